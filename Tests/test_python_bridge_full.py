@@ -10,15 +10,54 @@ import bpy
 import sys
 import os
 import json
+import shutil
+import tempfile
+import threading
 from pathlib import Path
 
-# Add the src/python directory to the path
-sys.path.append('src/python')
+# Add the src/python directory to the path (once per process, so repeated
+# test invocations don't grow sys.path and slow every later import scan)
+if 'src/python' not in sys.path:
+    sys.path.append('src/python')
 
 # Import our modules
 import tahlia_core
 import tahlia_bridge
 
+# Shared OBJ fixture content - identical for every test asset, so it is
+# built once and written into a single temp directory reused by all tests.
+TEST_OBJ_CONTENT = """# Test OBJ file
+v 0.0 0.0 0.0
+v 1.0 0.0 0.0
+v 0.0 1.0 0.0
+f 1 2 3
+"""
+
+_fixture_dir = None
+_fixture_assets = []
+_fixture_lock = threading.Lock()
+
+def get_test_assets(count):
+    """Return paths to `count` shared OBJ fixture files, creating them on first use."""
+    global _fixture_dir
+    with _fixture_lock:
+        if _fixture_dir is None:
+            _fixture_dir = tempfile.mkdtemp(prefix="tahlia_test_assets_")
+        while len(_fixture_assets) < count:
+            path = os.path.join(_fixture_dir, f"test_asset_{len(_fixture_assets)}.obj")
+            with open(path, 'w') as f:
+                f.write(TEST_OBJ_CONTENT)
+            _fixture_assets.append(path)
+        return _fixture_assets[:count]
+
+def cleanup_test_assets():
+    """Remove the shared fixture directory in one rmtree call."""
+    global _fixture_dir
+    if _fixture_dir is not None:
+        shutil.rmtree(_fixture_dir, ignore_errors=True)
+        _fixture_dir = None
+        _fixture_assets.clear()
+
 def test_context_capture():
     """Test context capture and restoration."""
     print("Testing context capture...")
@@ -96,32 +135,16 @@ def test_asset_import():
     """Test asset importing functionality."""
     print("Testing asset import...")
     
-    # Create a test OBJ file (simplified)
-    test_obj_content = """# Test OBJ file
-v 0.0 0.0 0.0
-v 1.0 0.0 0.0
-v 0.0 1.0 0.0
-f 1 2 3
-"""
-    
-    test_obj_path = "test_cube.obj"
-    with open(test_obj_path, 'w') as f:
-        f.write(test_obj_content)
-    
-    try:
-        # Test importing the asset
-        result = tahlia_bridge.import_asset_blender(test_obj_path, {})
-        print(f"Import result: {result}")
-        
-        # Verify import was successful
-        assert result['success']
-        assert "test_cube.obj" in result['data']['file_path']
-        
-    finally:
-        # Clean up
-        if os.path.exists(test_obj_path):
-            os.remove(test_obj_path)
-    
+    test_obj_path = get_test_assets(1)[0]
+
+    # Test importing the asset
+    result = tahlia_bridge.import_asset_blender(test_obj_path, {})
+    print(f"Import result: {result}")
+
+    # Verify import was successful
+    assert result['success']
+    assert test_obj_path in result['data']['file_path']
+
     print("✅ Asset import test passed!")
 
 def test_material_creation():
@@ -168,107 +191,73 @@ def test_grid_import():
     """Test grid import pattern."""
     print("Testing grid import...")
     
-    # Create test assets
-    test_assets = []
-    for i in range(4):
-        obj_content = f"""# Test OBJ file {i}
-v 0.0 0.0 0.0
-v 1.0 0.0 0.0
-v 0.0 1.0 0.0
-f 1 2 3
-"""
-        asset_path = f"test_asset_{i}.obj"
-        with open(asset_path, 'w') as f:
-            f.write(obj_content)
-        test_assets.append(asset_path)
-    
-    try:
-        # Test grid import
-        results = tahlia_core.import_assets_grid(test_assets, {}, 2, 2, 3.0)
-        print(f"Grid import results: {results}")
-        
-        # Verify all imports were successful
-        for result in results:
-            assert result['success']
-        
-    finally:
-        # Clean up
-        for asset_path in test_assets:
-            if os.path.exists(asset_path):
-                os.remove(asset_path)
-    
+    test_assets = get_test_assets(4)
+
+    # Test grid import
+    results = tahlia_core.import_assets_grid(test_assets, {}, 2, 2, 3.0)
+    print(f"Grid import results: {results}")
+
+    # Verify all imports were successful
+    for result in results:
+        assert result['success']
+
     print("✅ Grid import test passed!")
 
 def test_circle_import():
     """Test circle import pattern."""
     print("Testing circle import...")
     
-    # Create test assets
-    test_assets = []
-    for i in range(6):
-        obj_content = f"""# Test OBJ file {i}
-v 0.0 0.0 0.0
-v 1.0 0.0 0.0
-v 0.0 1.0 0.0
-f 1 2 3
-"""
-        asset_path = f"test_circle_asset_{i}.obj"
-        with open(asset_path, 'w') as f:
-            f.write(obj_content)
-        test_assets.append(asset_path)
-    
-    try:
-        # Test circle import
-        results = tahlia_core.import_assets_circle(test_assets, {}, 5.0)
-        print(f"Circle import results: {results}")
-        
-        # Verify all imports were successful
-        for result in results:
-            assert result['success']
-        
-    finally:
-        # Clean up
-        for asset_path in test_assets:
-            if os.path.exists(asset_path):
-                os.remove(asset_path)
-    
+    test_assets = get_test_assets(6)
+
+    # Test circle import
+    results = tahlia_core.import_assets_circle(test_assets, {}, 5.0)
+    print(f"Circle import results: {results}")
+
+    # Verify all imports were successful
+    for result in results:
+        assert result['success']
+
     print("✅ Circle import test passed!")
 
 def test_line_import():
     """Test line import pattern."""
     print("Testing line import...")
     
-    # Create test assets
-    test_assets = []
-    for i in range(3):
-        obj_content = f"""# Test OBJ file {i}
-v 0.0 0.0 0.0
-v 1.0 0.0 0.0
-v 0.0 1.0 0.0
-f 1 2 3
-"""
-        asset_path = f"test_line_asset_{i}.obj"
-        with open(asset_path, 'w') as f:
-            f.write(obj_content)
-        test_assets.append(asset_path)
-    
-    try:
-        # Test line import
-        results = tahlia_core.import_assets_line(test_assets, {}, 2.0)
-        print(f"Line import results: {results}")
-        
-        # Verify all imports were successful
-        for result in results:
-            assert result['success']
-        
-    finally:
-        # Clean up
-        for asset_path in test_assets:
-            if os.path.exists(asset_path):
-                os.remove(asset_path)
-    
+    test_assets = get_test_assets(3)
+
+    # Test line import
+    results = tahlia_core.import_assets_line(test_assets, {}, 2.0)
+    print(f"Line import results: {results}")
+
+    # Verify all imports were successful
+    for result in results:
+        assert result['success']
+
     print("✅ Line import test passed!")
 
+def run_pattern_tests():
+    """
+    Run the three import-pattern tests back to back.
+
+    bpy shares one global scene, so the Blender calls themselves must stay
+    on the main thread; the independent non-bpy preparation (fixture file
+    creation) is overlapped in a thread pool up front, and each pattern is
+    isolated with the bridge's context stack instead of serial scene rebuilds.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Prepare all fixture assets for the three patterns concurrently
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        for future in [pool.submit(get_test_assets, n) for n in (4, 6, 3)]:
+            future.result()
+
+    for pattern_test in (test_grid_import, test_circle_import, test_line_import):
+        tahlia_bridge.push_context()
+        try:
+            pattern_test()
+        finally:
+            tahlia_bridge.pop_context()
+
 def test_supported_formats():
     """Test supported formats functionality."""
     print("Testing supported formats...")
@@ -339,9 +328,7 @@ def main():
         test_context_stack()
         test_asset_import()
         test_material_creation()
-        test_grid_import()
-        test_circle_import()
-        test_line_import()
+        run_pattern_tests()
         test_supported_formats()
         test_debug_mode()
         test_context_preservation()
@@ -356,7 +343,9 @@ def main():
         import traceback
         traceback.print_exc()
         return False
-    
+    finally:
+        cleanup_test_assets()
+
     return True
 
 if __name__ == "__main__":
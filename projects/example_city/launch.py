@@ -0,0 +1,90 @@
+"""
+Author: KleaSCM
+Email: KleaSCM@gmail.com
+Name: launch.py
+Description: Launcher for the example city demo. Re-execs Blender with this
+              script when run from a plain terminal, and runs the demo directly
+              when already inside Blender's Python.
+"""
+
+import sys
+from pathlib import Path
+
+demo_path = Path(__file__).resolve().parent
+if str(demo_path) not in sys.path:
+    sys.path.insert(0, str(demo_path))
+
+
+def is_blender() -> bool:
+    """
+    Check whether we are running inside Blender's bundled Python.
+
+    Returns:
+        True if the bpy module is importable, False otherwise
+    """
+    try:
+        import bpy  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _asset_args() -> list:
+    """
+    Extract asset paths passed after '--' on the command line.
+
+    Blender forwards everything after '--' untouched, so a single
+    'blender --python launch.py -- a.blend b.blend' processes the whole
+    batch in one Blender session.
+
+    Returns:
+        List of asset path strings, empty when none were passed
+    """
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return []
+
+
+def run_blender() -> int:
+    """
+    Launch Blender with this script so the demo runs inside Blender.
+
+    Returns:
+        The Blender process exit code
+    """
+    import argparse
+    import shutil
+    import subprocess
+
+    parser = argparse.ArgumentParser(description="Launch the example city demo in Blender")
+    parser.add_argument(
+        "--asset",
+        action="append",
+        default=[],
+        help="Tree asset file to import (repeatable; all assets share one Blender session)"
+    )
+    args = parser.parse_args()
+
+    blender = shutil.which("blender")
+    if blender is None:
+        print("❌ Blender executable not found on PATH")
+        return 1
+
+    cmd = [blender, "--python", str(Path(__file__).resolve())]
+    if args.asset:
+        cmd.append("--")
+        cmd.extend(args.asset)
+    return subprocess.call(cmd)
+
+
+if __name__ == "__main__":
+    if is_blender():
+        assets = _asset_args()
+        if assets:
+            from project import import_tree_assets
+            import_tree_assets([Path(a) for a in assets])
+        else:
+            from project import main
+            main()
+    else:
+        sys.exit(run_blender())
@@ -0,0 +1,540 @@
+"""
+Author: KleaSCM
+Email: KleaSCM@gmail.com
+Name: project.py
+Description: Example city demo project for the Tahlia asset management system.
+              Runs the C++ asset audit, discovers tree assets in the universal
+              Assets/ library, and builds a small demo scene inside Blender.
+"""
+
+import os
+import re
+import sys
+import queue
+import threading
+import functools
+from pathlib import Path
+from typing import List, Optional
+
+# Project root is three levels up: projects/example_city/project.py
+project_root = Path(__file__).resolve().parent.parent.parent
+assets_dir = project_root / "Assets"
+
+
+@functools.lru_cache(maxsize=1)
+def get_asset_manager_path() -> Path:
+    """
+    Get the path to the compiled C++ asset manager binary.
+
+    Returns:
+        Path to the blender_asset_manager executable
+    """
+    return project_root / "build" / "blender_asset_manager"
+
+
+@functools.lru_cache(maxsize=1)
+def _asset_manager_ready() -> Optional[Path]:
+    """
+    Resolve the asset manager binary once, including the existence check.
+
+    Returns:
+        Path to the binary if it exists, None otherwise
+    """
+    manager_path = get_asset_manager_path()
+    return manager_path if manager_path.exists() else None
+
+
+def run_asset_audit() -> Optional[str]:
+    """
+    Run the C++ asset audit over the Assets/ library.
+
+    Returns:
+        The audit output, or None if the asset manager is unavailable
+    """
+    manager_path = _asset_manager_ready()
+    if manager_path is None:
+        print("⚠️ Asset manager binary not found, skipping audit")
+        return None
+
+    import subprocess
+
+    # Stream the audit output line by line so Python-side processing
+    # overlaps the C++ tool's emission instead of buffering everything.
+    # stderr is merged into the same pipe: draining stdout to EOF with a
+    # separate buffered stderr pipe deadlocks once the tool fills the
+    # stderr buffer, and the combined text is only needed on failure
+    proc = subprocess.Popen(
+        [str(manager_path), "--audit"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        cwd=str(project_root)
+    )
+    lines: List[str] = []
+    first = True
+    for line in proc.stdout:
+        if first:
+            print("✅ Asset audit running...")
+            first = False
+        lines.append(line)
+    if proc.wait() != 0:
+        print(f"❌ Asset audit failed: {''.join(lines[-20:]).strip()}")
+        return None
+
+    print("✅ Asset audit complete")
+    return ''.join(lines)
+
+
+def _iter_files(path: str):
+    """
+    Recursively yield file DirEntry objects below path.
+
+    Uses os.scandir so the dirent type information returned by the kernel
+    answers is_dir()/is_file() without an extra stat() per entry.
+
+    Args:
+        path: Directory to walk
+
+    Yields:
+        os.DirEntry for each regular file found
+    """
+    for entry in os.scandir(path):
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_files(entry.path)
+        elif entry.is_file(follow_symlinks=False):
+            yield entry
+
+
+def run_combined_query() -> Optional[dict]:
+    """
+    Run the asset audit and the tree listing as one asset-manager call.
+
+    Spawning the C++ tool separately for the audit and the tree search
+    pays fork+exec+startup twice; the compound '--audit --list-trees'
+    command emits a single JSON blob with both sections.
+
+    Returns:
+        Parsed payload with 'audit' and 'trees' sections, or None when the
+        binary is missing or does not support the compound command
+    """
+    manager_path = _asset_manager_ready()
+    if manager_path is None:
+        return None
+
+    import subprocess
+    import json
+
+    result = subprocess.run(
+        [str(manager_path), "--audit", "--list-trees"],
+        capture_output=True,
+        text=True,
+        cwd=str(project_root)
+    )
+    if result.returncode != 0:
+        return None
+    try:
+        return json.loads(result.stdout)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _audit_payload_for(mtime_ns: int) -> Optional[dict]:
+    """Memoized combined-query payload, keyed on the binary's mtime."""
+    return run_combined_query()
+
+
+def _cached_audit_payload() -> Optional[dict]:
+    """
+    Fetch the combined audit payload, reusing it across callers.
+
+    The cache key is the asset-manager binary's mtime so a rebuilt tool
+    invalidates stale payloads automatically.
+
+    Returns:
+        Parsed payload, or None when unavailable
+    """
+    manager_path = _asset_manager_ready()
+    if manager_path is None:
+        return None
+    return _audit_payload_for(manager_path.stat().st_mtime_ns)
+
+
+# Tree-asset matching hoisted out of the per-file hot path: one C-level
+# regex scan instead of a lower() allocation plus substring and suffix tests
+_TREE_EXTS = (".blend", ".obj", ".fbx")
+_TREE_RE = re.compile(r'tree.*\.(blend|obj|fbx)$', re.IGNORECASE)
+
+
+def _matches_tree_asset(name: str) -> bool:
+    """Check whether a filename looks like a tree model asset."""
+    return _TREE_RE.search(name) is not None
+
+
+def _parallel_find_trees(root: str, n_threads: Optional[int] = None) -> List[str]:
+    """
+    Walk a directory tree with a pool of worker threads.
+
+    Directory reads are I/O bound, so concurrent scandir calls overlap
+    getdents latency across workers. A LIFO work queue keeps workers on
+    recently discovered (cache-hot) subtrees.
+
+    Args:
+        root: Directory to walk
+        n_threads: Worker count, defaults to min(32, cpu_count * 4)
+
+    Returns:
+        List of paths to matching tree asset files
+    """
+    if n_threads is None:
+        n_threads = min(32, (os.cpu_count() or 1) * 4)
+
+    work: "queue.LifoQueue[str]" = queue.LifoQueue()
+    work.put(root)
+    results: List[str] = []
+    lock = threading.Lock()
+    done = threading.Condition()
+    outstanding = [1]
+
+    def worker() -> None:
+        while True:
+            with done:
+                if outstanding[0] == 0:
+                    return
+            try:
+                directory = work.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            found: List[str] = []
+            subdirs = 0
+            try:
+                for entry in os.scandir(directory):
+                    if entry.is_dir(follow_symlinks=False):
+                        work.put(entry.path)
+                        subdirs += 1
+                    elif entry.is_file(follow_symlinks=False):
+                        if _matches_tree_asset(entry.name):
+                            found.append(entry.path)
+            except OSError:
+                pass
+            if found:
+                with lock:
+                    results.extend(found)
+            with done:
+                outstanding[0] += subdirs - 1
+                if outstanding[0] == 0:
+                    done.notify_all()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(n_threads)]
+    for t in threads:
+        t.start()
+    with done:
+        while outstanding[0] > 0:
+            done.wait()
+    for t in threads:
+        t.join()
+    return results
+
+
+def find_tree_assets() -> List[str]:
+    """
+    Find tree assets (tree-named model files) in the Assets/ library.
+
+    Returns:
+        List of paths to tree asset files
+    """
+    # Reuse the audit's file listing when available - the C++ tool already
+    # walked the Assets tree, so there is no need to walk it again
+    payload = _cached_audit_payload()
+    if payload is not None:
+        files = payload.get("files")
+        if files:
+            tree_assets = [
+                entry["path"] for entry in files
+                if _TREE_RE.search(entry.get("name", ""))
+            ]
+            print(f"🌳 Found {len(tree_assets)} tree assets (from audit)")
+            return tree_assets
+
+    tree_assets: List[str] = []
+    if not assets_dir.exists():
+        print("⚠️ Assets directory not found")
+        return tree_assets
+
+    # Small trees are not worth the thread-pool setup cost
+    root_entries = list(os.scandir(str(assets_dir)))
+    if len(root_entries) < 64 and not any(e.is_dir(follow_symlinks=False) for e in root_entries):
+        for entry in root_entries:
+            if entry.is_file(follow_symlinks=False) and _matches_tree_asset(entry.name):
+                tree_assets.append(entry.path)
+    else:
+        tree_assets = _parallel_find_trees(str(assets_dir))
+
+    print(f"🌳 Found {len(tree_assets)} tree assets")
+    return tree_assets
+
+
+def _link_objects_deferred(objects) -> None:
+    """
+    Link objects into the scene with a single deferred dep-graph update.
+
+    Each collection.objects.link() tags the dependency graph; linking N
+    objects normally costs N invalidations. Locking the interface and
+    suppressing redraws while linking flattens that to one update at the
+    end of the batch.
+
+    Args:
+        objects: Iterable of objects to link (None entries are skipped)
+    """
+    import bpy
+
+    link = bpy.context.scene.collection.objects.link
+    render = bpy.context.scene.render
+    prev_lock = render.use_lock_interface
+    render.use_lock_interface = True
+    try:
+        with bpy.context.temp_override(window=None):
+            for obj in objects:
+                if obj is not None:
+                    link(obj)
+    finally:
+        render.use_lock_interface = prev_lock
+
+    # One dependency-graph update for the whole batch
+    bpy.context.view_layer.update()
+
+
+def _fast_clear_scene() -> None:
+    """
+    Remove every object directly through the data API.
+
+    Avoids bpy.ops.object.select_all + delete, which run full operators
+    with context overrides, undo pushes, and dependency-graph updates.
+    """
+    import bpy
+
+    global _scene_ready
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    _scene_ready = False
+
+
+# Shared node-material template; Material.copy() duplicates the node tree
+# at C speed, so the use_nodes=True default-tree build happens exactly once
+_template_mat = None
+
+
+def _new_node_material(name: str):
+    """
+    Create a node material by cloning the shared template.
+
+    Args:
+        name: Name for the new material
+
+    Returns:
+        The new material, with a ready-built Principled BSDF node tree
+    """
+    import bpy
+
+    global _template_mat
+    if _template_mat is None or _template_mat.name not in bpy.data.materials:
+        _template_mat = bpy.data.materials.new("_tahlia_template")
+        _template_mat.use_nodes = True
+    mat = _template_mat.copy()
+    mat.name = name
+    return mat
+
+
+def _set_base_color(mat, rgba) -> None:
+    """Set the Principled BSDF base color on a node material."""
+    principled = mat.node_tree.nodes.get("Principled BSDF")
+    if principled is not None:
+        principled.inputs['Base Color'].default_value = rgba
+
+
+# Sentinel so batched imports only pay for one scene build
+_scene_ready = False
+
+
+def reset_demo_scene() -> None:
+    """Tear down the generated demo scene objects and clear the sentinel."""
+    import bpy
+
+    global _scene_ready
+    for name in ("Ground", "Sun", "Camera"):
+        obj = bpy.data.objects.get(name)
+        if obj is not None:
+            bpy.data.objects.remove(obj, do_unlink=True)
+    _scene_ready = False
+
+
+def setup_demo_scene() -> None:
+    """Set up the demo scene: ground plane, sun light, and camera."""
+    import bpy
+    import bmesh
+
+    global _scene_ready
+    if _scene_ready:
+        return
+
+    scene = bpy.context.scene
+
+    # Ground plane built directly, skipping operator dispatch
+    ground_mesh = bpy.data.meshes.new("Ground")
+    bm = bmesh.new()
+    bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=25.0)
+    bm.to_mesh(ground_mesh)
+    bm.free()
+    ground = bpy.data.objects.new("Ground", ground_mesh)
+    scene.collection.objects.link(ground)
+
+    # Reuse the material if an earlier scene build already created it
+    ground_mat = bpy.data.materials.get("Ground_Material")
+    if ground_mat is None:
+        ground_mat = _new_node_material("Ground_Material")
+        _set_base_color(ground_mat, (0.2, 0.5, 0.2, 1.0))
+    ground.data.materials.append(ground_mat)
+
+    # Sun light
+    sun_data = bpy.data.lights.new("Sun", type='SUN')
+    sun_data.energy = 3.0
+    sun = bpy.data.objects.new("Sun", sun_data)
+    sun.location = (5, 5, 10)
+    scene.collection.objects.link(sun)
+
+    # Camera
+    camera_data = bpy.data.cameras.new("Camera")
+    camera = bpy.data.objects.new("Camera", camera_data)
+    camera.location = (15, -15, 10)
+    camera.rotation_euler = (1.1, 0, 0.785)
+    scene.collection.objects.link(camera)
+    scene.camera = camera
+
+    _scene_ready = True
+
+
+def create_demo_cube() -> None:
+    """Create a fallback demo cube when no tree assets are available."""
+    import bpy
+    import bmesh
+
+    cube_mesh = bpy.data.meshes.new("Demo_Cube")
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=2.0)
+    bm.to_mesh(cube_mesh)
+    bm.free()
+    cube = bpy.data.objects.new("Demo_Cube", cube_mesh)
+    cube.location = (0, 0, 1)
+    bpy.context.scene.collection.objects.link(cube)
+
+    cube_mat = _new_node_material("Cube_Material")
+    _set_base_color(cube_mat, (0.8, 0.4, 0.1, 1.0))
+    cube.data.materials.append(cube_mat)
+
+
+def import_tree_assets(asset_paths: List[Path]) -> bool:
+    """
+    Import a batch of tree assets into a fresh demo scene.
+
+    All assets are loaded inside the same Blender session so the
+    multi-second Blender startup is paid once per batch rather than once
+    per asset, and the demo scene is set up a single time at the end.
+
+    Args:
+        asset_paths: Paths to the .blend files to import
+
+    Returns:
+        True if every import succeeded, False otherwise
+    """
+    import bpy
+
+    # Clear the current scene once for the whole batch
+    _fast_clear_scene()
+
+    ok = True
+    for asset_path in asset_paths:
+        try:
+            with bpy.data.libraries.load(str(asset_path)) as (data_from, data_to):
+                data_to.objects = data_from.objects
+
+            _link_objects_deferred(data_to.objects)
+
+            print(f"✅ Imported tree asset: {asset_path}")
+        except Exception as e:
+            print(f"❌ Failed to import tree asset {asset_path}: {e}")
+            ok = False
+
+    setup_demo_scene()
+    return ok
+
+
+def import_tree_asset(asset_path: Path) -> bool:
+    """
+    Import a single tree asset into a fresh demo scene.
+
+    Args:
+        asset_path: Path to the .blend file to import
+
+    Returns:
+        True if the import succeeded, False otherwise
+    """
+    return import_tree_assets([asset_path])
+
+
+def import_specific_assets() -> bool:
+    """
+    Import the demo tree asset used by the example city scene.
+
+    Returns:
+        True if the import succeeded, False otherwise
+    """
+    import bpy
+
+    tree_path = project_root / "Assets" / "Models" / "Environment" / "Trees" / "Tree1.blend"
+    if not tree_path.exists():
+        print("⚠️ Tree1.blend not found, creating demo cube instead")
+        create_demo_cube()
+        setup_demo_scene()
+        return False
+
+    # Clear the current scene
+    _fast_clear_scene()
+
+    # Pull only tree-like datablocks; asset-pack blends commonly carry
+    # stray cameras, lamps, and helper objects we never want linked
+    with bpy.data.libraries.load(str(tree_path)) as (data_from, data_to):
+        data_to.objects = [
+            name for name in data_from.objects
+            if name.lower().startswith(("tree", "leaf", "branch", "trunk"))
+        ]
+
+    _link_objects_deferred(data_to.objects)
+
+    setup_demo_scene()
+    print(f"✅ Imported demo assets from {tree_path}")
+    return True
+
+
+def main() -> None:
+    """Run the example city demo."""
+    print("🏙️ Tahlia example city demo")
+    print("=" * 50)
+
+    # One subprocess round-trip when the compound command is supported
+    payload = _cached_audit_payload()
+    if payload is not None:
+        print("✅ Asset audit complete")
+        tree_assets = payload.get("trees", [])
+        print(f"🌳 Found {len(tree_assets)} tree assets")
+    else:
+        run_asset_audit()
+        find_tree_assets()
+
+    import_specific_assets()
+
+    print("🎉 Demo scene ready!")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,192 @@ import bpy
 import sys
 import os
 import json
+import struct
 from typing import Dict, Any, Optional, List
 
+# orjson's C codec is several times faster than stdlib json on the
+# nested option/result dicts crossing the CLI boundary, and emitting
+# bytes straight to stdout skips a UTF-8 encode; fall back to stdlib
+# when it is not installed
+try:
+    import orjson
+
+    def _loads(data: str) -> Any:
+        return orjson.loads(data)
+
+    def _print_json(obj: Any) -> None:
+        sys.stdout.buffer.write(orjson.dumps(obj))
+        sys.stdout.buffer.write(b'\n')
+except ImportError:
+    def _loads(data: str) -> Any:
+        return json.loads(data)
+
+    def _print_json(obj: Any) -> None:
+        print(json.dumps(obj))
+
+# Node-type and socket-name constants interned once at import; the hot
+# loops compare RNA-returned strings against these, and interning lets
+# CPython short-circuit on pointer identity before char comparison
+_PRINCIPLED = sys.intern('BSDF_PRINCIPLED')
+_TEX_IMAGE = sys.intern('TEX_IMAGE')
+_OUTPUT_MATERIAL = sys.intern('OUTPUT_MATERIAL')
+_NORMAL_MAP = sys.intern('NORMAL_MAP')
+_DISPLACEMENT = sys.intern('DISPLACEMENT')
+_MIX_RGB = sys.intern('MIX_RGB')
+_BASE_COLOR = sys.intern('Base Color')
+
+# Maps that carry data rather than color; marking them Non-Color skips
+# the per-texel sRGB->linear conversion Blender otherwise applies at
+# shade time
+_NON_COLOR_TYPES = frozenset({'normal', 'roughness', 'metallic', 'displacement'})
+
+# Images already loaded this session, keyed by resolved path. Reusing the
+# datablock skips the disk read and decode Blender performs on every
+# bpy.data.images.load, which dominates when materials share tiling maps.
+_IMG_CACHE: Dict[str, Any] = {}
+
+# name -> material map for bursts of operations on the same material
+# (assign + validate + optimize from the C++ bridge). Datablocks can be
+# renamed or deleted between CLI runs, so entries are revalidated by name
+# and the cache is cleared at the start of each command.
+_MAT_CACHE: Dict[str, Any] = {}
+
+def _get_mat(name: str) -> Any:
+    """
+    Look up a material by name through the short-lived cache
+
+    Args:
+        name: Material name
+
+    Returns:
+        The material datablock, or None if it does not exist
+    """
+    mat = _MAT_CACHE.get(name)
+    if mat is None or mat.name != name:
+        mat = bpy.data.materials.get(name)
+        _MAT_CACHE[name] = mat
+    return mat
+
+# Hidden template material cloned by create_material; node creation in
+# Blender is far slower than copying existing nodes, so the canonical
+# Principled+Output subtree is built once and copied per material
+_TEMPLATE_MAT_NAME = 'TahliaMaterialTemplate'
+
+def _template_material() -> Any:
+    """
+    Return the base material template, building it on first use
+
+    Returns:
+        A hidden material with Principled BSDF wired to Material Output
+    """
+    template = bpy.data.materials.get(_TEMPLATE_MAT_NAME)
+    if template is None:
+        template = bpy.data.materials.new(name=_TEMPLATE_MAT_NAME)
+        template.use_nodes = True
+        nodes = template.node_tree.nodes
+        nodes.clear()
+        principled = nodes.new('ShaderNodeBsdfPrincipled')
+        principled.location = (0, 0)
+        output = nodes.new('ShaderNodeOutputMaterial')
+        output.location = (300, 0)
+        template.node_tree.links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+        # Keep the template alive across garbage-collect passes
+        template.use_fake_user = True
+    return template
+
+# Principled BSDF scalar inputs set by create_material: (socket name,
+# options key, default). Driven as a table so the sockets are resolved
+# once each, and names absent in a given Blender version (e.g. 'Specular'
+# was renamed in 4.x) are skipped instead of raising
+_PRINCIPLED_DEFAULTS = (
+    ('Metallic', 'metallic', 0.0),
+    ('Roughness', 'roughness', 0.5),
+    ('Specular', 'specular', 0.5),
+    ('Clearcoat', 'clearcoat', 0.0),
+    ('Clearcoat Roughness', 'clearcoat_roughness', 0.0),
+    ('IOR', 'ior', 1.45),
+    ('Transmission', 'transmission', 0.0),
+    ('Transmission Roughness', 'transmission_roughness', 0.0),
+    ('Emission Strength', 'emission_strength', 0.0),
+    ('Alpha', 'alpha', 1.0),
+)
+
+# Texture option keys create_material understands; also the set that
+# options['defer_textures'] records for finalize_material to attach later
+_TEXTURE_OPTION_KEYS = (
+    'albedo_texture',
+    'normal_texture',
+    'roughness_texture',
+    'metallic_texture',
+    'ao_texture',
+    'emission_texture',
+    'displacement_texture',
+)
+
+# texture_type -> (Principled input name, intermediate node type), built
+# once so assign_texture resolves the wiring with one dict lookup instead
+# of walking an if/elif ladder that re-resolves RNA input names per branch
+_ASSIGN_HANDLERS = {
+    'albedo': ('Base Color', None),
+    'roughness': ('Roughness', None),
+    'metallic': ('Metallic', None),
+    'emission': ('Emission Color', None),
+    'normal': (None, 'ShaderNodeNormalMap'),
+    'displacement': (None, 'ShaderNodeDisplacement'),
+    'ao': (None, 'ShaderNodeMixRGB'),
+}
+
+# (material name, role) -> node name for the intermediate nodes
+# assign_texture reuses across calls. In a long-lived bridge process a
+# re-texture becomes a couple of pointer updates instead of a node build;
+# stale entries simply miss in nodes.get and are rebuilt.
+_NODE_POOL: Dict[tuple, str] = {}
+
+def _pooled_node(nodes, mat_name: str, role: str, node_type: str, rna_type: str) -> Any:
+    """
+    Fetch or create an intermediate node reused across bridge calls
+
+    Args:
+        nodes: The material's node collection
+        mat_name: Name of the owning material
+        role: Pool role key (e.g. 'normal_map')
+        node_type: bl_idname used when a new node must be created
+        rna_type: RNA node type matched when adopting an existing node
+
+    Returns:
+        The pooled, adopted, or newly created node
+    """
+    key = (mat_name, role)
+    name = _NODE_POOL.get(key)
+    node = nodes.get(name) if name else None
+    if node is None:
+        # Adopt a matching node built elsewhere (e.g. by create_material)
+        # before paying for a new one
+        node = next((n for n in nodes if n.type == rna_type), None)
+        if node is None:
+            node = nodes.new(node_type)
+        _NODE_POOL[key] = node.name
+    return node
+
+def _load_image(path: str) -> Any:
+    """
+    Load an image datablock, reusing one already loaded for the same file
+
+    Args:
+        path: Path to the image file
+
+    Returns:
+        The bpy image datablock for the file
+    """
+    key = os.path.realpath(path)
+    img = _IMG_CACHE.get(key)
+    if img is None or img.name not in bpy.data.images:
+        # check_existing lets Blender's own dedup fire even if the cache
+        # was cleared between sessions
+        img = bpy.data.images.load(key, check_existing=True)
+        _IMG_CACHE[key] = img
+    return img
+
 def create_material(options: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a material with the specified options
@@ -22,129 +206,286 @@ def create_material(options: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary with result information
     """
+    # Lock the interface so the node edits below don't each fire
+    # notifier/redraw dispatch; the tree is update-tagged once at the end
+    render = bpy.context.scene.render
+    previous_lock = render.use_lock_interface
+    render.use_lock_interface = True
     try:
-        # Create material
-        mat = bpy.data.materials.new(name=options.get('name', 'NewMaterial'))
-        mat.use_nodes = options.get('use_nodes', True)
-        
+        # Create material - cloning the template skips both the default
+        # node-tree build use_nodes triggers and the per-material
+        # Principled/Output construction and linking
+        if options.get('use_nodes', True):
+            mat = _template_material().copy()
+            mat.name = options.get('name', 'NewMaterial')
+            mat.use_fake_user = False
+        else:
+            mat = bpy.data.materials.new(name=options.get('name', 'NewMaterial'))
+            mat.use_nodes = False
+
         if mat.use_nodes:
             nodes = mat.node_tree.nodes
             links = mat.node_tree.links
-            
-            # Clear default nodes
-            nodes.clear()
-            
-            # Create Principled BSDF
-            principled = nodes.new('ShaderNodeBsdfPrincipled')
-            principled.location = (0, 0)
-            
-            # Set PBR parameters
-            principled.inputs['Metallic'].default_value = options.get('metallic', 0.0)
-            principled.inputs['Roughness'].default_value = options.get('roughness', 0.5)
-            principled.inputs['Specular'].default_value = options.get('specular', 0.5)
-            principled.inputs['Clearcoat'].default_value = options.get('clearcoat', 0.0)
-            principled.inputs['Clearcoat Roughness'].default_value = options.get('clearcoat_roughness', 0.0)
-            principled.inputs['IOR'].default_value = options.get('ior', 1.45)
-            principled.inputs['Transmission'].default_value = options.get('transmission', 0.0)
-            principled.inputs['Transmission Roughness'].default_value = options.get('transmission_roughness', 0.0)
-            principled.inputs['Emission Strength'].default_value = options.get('emission_strength', 0.0)
-            principled.inputs['Alpha'].default_value = options.get('alpha', 1.0)
-            
-            # Create Material Output
-            output = nodes.new('ShaderNodeOutputMaterial')
-            output.location = (300, 0)
-            
-            # Link nodes
-            links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-            
-            # Add texture nodes if textures are specified
+
+            # The copied tree already holds the wired Principled and Output
+            principled = output = None
+            for node in nodes:
+                node_type = node.type
+                if node_type == _PRINCIPLED:
+                    principled = node
+                elif node_type == _OUTPUT_MATERIAL:
+                    output = node
+
+            # Set PBR parameters from the table; get_input resolves each
+            # socket once and absent names are skipped for cross-version
+            # compatibility
+            get_input = principled.inputs.get
+            get_option = options.get
+            for socket_name, option_key, default in _PRINCIPLED_DEFAULTS:
+                sock = get_input(socket_name)
+                if sock is not None:
+                    sock.default_value = get_option(option_key, default)
+
+            # Socket references used more than once resolve a single time;
+            # each inputs['Name'] is a string-keyed RNA collection walk
+            principled_inputs = principled.inputs
+            p_base = principled_inputs[_BASE_COLOR]
+
+            # Add texture nodes if textures are specified. Locations are
+            # accumulated and written in one foreach_set at the end
+            # instead of one RNA attribute write per node
             texture_nodes = {}
+            pending_locations = []
+
+            if options.get('defer_textures'):
+                # Image decode is the heaviest part of material setup;
+                # record only the paths as custom properties and let
+                # finalize_material attach the datablocks right before
+                # they are actually needed
+                for opt_key in _TEXTURE_OPTION_KEYS:
+                    path = get_option(opt_key)
+                    if path:
+                        mat['tahlia_deferred_' + opt_key] = path
+                options = {k: v for k, v in options.items() if k not in _TEXTURE_OPTION_KEYS}
             
             # Albedo texture
             if options.get('albedo_texture'):
                 tex = nodes.new('ShaderNodeTexImage')
-                tex.location = (-300, 200)
-                tex.image = bpy.data.images.load(options['albedo_texture'])
-                links.new(tex.outputs['Color'], principled.inputs['Base Color'])
+                pending_locations.append((tex, -300.0, 200.0))
+                tex.image = _load_image(options['albedo_texture'])
+                links.new(tex.outputs['Color'], p_base)
                 texture_nodes['albedo'] = tex
             
             # Normal texture
             if options.get('normal_texture'):
                 tex = nodes.new('ShaderNodeTexImage')
-                tex.location = (-300, 0)
-                tex.image = bpy.data.images.load(options['normal_texture'])
+                pending_locations.append((tex, -300.0, 0.0))
+                tex.image = _load_image(options['normal_texture'])
+                tex.image.colorspace_settings.name = 'Non-Color'
                 normal_map = nodes.new('ShaderNodeNormalMap')
-                normal_map.location = (-100, 0)
+                pending_locations.append((normal_map, -100.0, 0.0))
                 links.new(tex.outputs['Color'], normal_map.inputs['Color'])
-                links.new(normal_map.outputs['Normal'], principled.inputs['Normal'])
+                links.new(normal_map.outputs['Normal'], principled_inputs['Normal'])
                 texture_nodes['normal'] = tex
             
             # Roughness texture
             if options.get('roughness_texture'):
                 tex = nodes.new('ShaderNodeTexImage')
-                tex.location = (-300, -200)
-                tex.image = bpy.data.images.load(options['roughness_texture'])
-                links.new(tex.outputs['Color'], principled.inputs['Roughness'])
+                pending_locations.append((tex, -300.0, -200.0))
+                tex.image = _load_image(options['roughness_texture'])
+                tex.image.colorspace_settings.name = 'Non-Color'
+                links.new(tex.outputs['Color'], principled_inputs['Roughness'])
                 texture_nodes['roughness'] = tex
             
             # Metallic texture
             if options.get('metallic_texture'):
                 tex = nodes.new('ShaderNodeTexImage')
-                tex.location = (-300, -400)
-                tex.image = bpy.data.images.load(options['metallic_texture'])
-                links.new(tex.outputs['Color'], principled.inputs['Metallic'])
+                pending_locations.append((tex, -300.0, -400.0))
+                tex.image = _load_image(options['metallic_texture'])
+                tex.image.colorspace_settings.name = 'Non-Color'
+                links.new(tex.outputs['Color'], principled_inputs['Metallic'])
                 texture_nodes['metallic'] = tex
             
             # AO texture
             if options.get('ao_texture'):
                 tex = nodes.new('ShaderNodeTexImage')
-                tex.location = (-300, -600)
-                tex.image = bpy.data.images.load(options['ao_texture'])
-                mix_rgb = nodes.new('ShaderNodeMixRGB')
-                mix_rgb.location = (-100, 200)
-                mix_rgb.blend_type = 'MULTIPLY'
-                links.new(tex.outputs['Color'], mix_rgb.inputs[2])
+                pending_locations.append((tex, -300.0, -600.0))
+                tex.image = _load_image(options['ao_texture'])
                 if 'albedo' in texture_nodes:
+                    mix_rgb = nodes.new('ShaderNodeMixRGB')
+                    pending_locations.append((mix_rgb, -100.0, 200.0))
+                    mix_rgb.blend_type = 'MULTIPLY'
+                    links.new(tex.outputs['Color'], mix_rgb.inputs[2])
                     links.new(texture_nodes['albedo'].outputs['Color'], mix_rgb.inputs[1])
-                    links.new(mix_rgb.outputs['Color'], principled.inputs['Base Color'])
+                    links.new(mix_rgb.outputs['Color'], p_base)
+                else:
+                    # No albedo to multiply against, so the MixRGB would
+                    # sit orphaned until optimize_material collects it;
+                    # wire AO straight into Base Color instead
+                    links.new(tex.outputs['Color'], p_base)
                 texture_nodes['ao'] = tex
             
             # Emission texture
             if options.get('emission_texture'):
                 tex = nodes.new('ShaderNodeTexImage')
-                tex.location = (-300, -800)
-                tex.image = bpy.data.images.load(options['emission_texture'])
-                links.new(tex.outputs['Color'], principled.inputs['Emission Color'])
+                pending_locations.append((tex, -300.0, -800.0))
+                tex.image = _load_image(options['emission_texture'])
+                links.new(tex.outputs['Color'], principled_inputs['Emission Color'])
                 texture_nodes['emission'] = tex
             
             # Displacement texture
             if options.get('displacement_texture'):
                 tex = nodes.new('ShaderNodeTexImage')
-                tex.location = (-300, -1000)
-                tex.image = bpy.data.images.load(options['displacement_texture'])
+                pending_locations.append((tex, -300.0, -1000.0))
+                tex.image = _load_image(options['displacement_texture'])
+                tex.image.colorspace_settings.name = 'Non-Color'
                 disp = nodes.new('ShaderNodeDisplacement')
-                disp.location = (-100, -1000)
+                pending_locations.append((disp, -100.0, -1000.0))
                 links.new(tex.outputs['Color'], disp.inputs['Height'])
                 links.new(disp.outputs['Displacement'], output.inputs['Displacement'])
                 texture_nodes['displacement'] = tex
-        
+
+            if pending_locations:
+                # One C-level write positions every node; untouched nodes
+                # keep the location the template copy gave them
+                desired = {node.as_pointer(): (x, y) for node, x, y in pending_locations}
+                flat = []
+                for node in nodes:
+                    xy = desired.get(node.as_pointer())
+                    if xy is None:
+                        xy = node.location
+                    flat.extend((xy[0], xy[1]))
+                nodes.foreach_set('location', flat)
+
         # Set material settings
         mat.use_backface_culling = options.get('backface_culling', False)
         
         if options.get('blend_method', False):
             mat.blend_method = 'BLEND'
-        
+
+        # One update tag for the whole construction instead of one
+        # notification per edit
+        if mat.use_nodes:
+            mat.node_tree.update_tag()
+
         return {
             'success': True,
             'material_name': mat.name,
             'message': 'Material created successfully'
         }
-        
+
     except Exception as e:
         return {
             'success': False,
             'message': f'Failed to create material: {str(e)}'
         }
+    finally:
+        render.use_lock_interface = previous_lock
+
+# Batches at least twice this size are sharded across headless Blender
+# worker processes; below it the fork/startup cost outweighs the win
+_PARALLEL_BATCH_MIN = 64
+
+def _create_materials_parallel(options_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Build a large material batch across headless Blender workers
+
+    Material creation is embarrassingly parallel up to the shared
+    bpy.data writes, so each worker process builds one shard into its
+    own temporary .blend and the parent pulls the shards back in through
+    bpy.data.libraries.load. Scales near-linearly until disk I/O
+    saturates.
+
+    Args:
+        options_list: List of option dictionaries, one per material
+
+    Returns:
+        List of result dictionaries, one per material
+    """
+    import shutil
+    import tempfile
+    import subprocess
+
+    blender = bpy.app.binary_path
+    n_shards = min(os.cpu_count() or 1, max(2, len(options_list) // _PARALLEL_BATCH_MIN))
+    # Contiguous shards so concatenating the per-shard results keeps the
+    # output aligned with options_list, like the in-process path
+    step = -(-len(options_list) // n_shards)
+    shards = [options_list[i * step:(i + 1) * step] for i in range(n_shards)]
+    shards = [shard for shard in shards if shard]
+    tmp_dir = tempfile.mkdtemp(prefix='tahlia_materials_')
+    try:
+        # All workers run concurrently; each saves a shard .blend plus a
+        # results JSON next to it
+        procs = []
+        for idx, shard in enumerate(shards):
+            blend_path = os.path.join(tmp_dir, f'shard_{idx}.blend')
+            # The shard rides in a temp file, not argv: big option lists
+            # with texture paths would blow past the kernel's per-argument
+            # limit exactly when batches are large enough to shard
+            shard_path = os.path.join(tmp_dir, f'shard_{idx}.options.json')
+            with open(shard_path, 'w') as f:
+                json.dump(shard, f)
+            procs.append((shard, blend_path, subprocess.Popen(
+                [blender, '--background', '--factory-startup',
+                 '--python', os.path.abspath(__file__), '--',
+                 'create_materials_blend', shard_path, blend_path],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )))
+
+        results: List[Dict[str, Any]] = []
+        for shard, blend_path, proc in procs:
+            if proc.wait() != 0 or not os.path.exists(blend_path):
+                results.extend(
+                    {'success': False, 'message': 'Worker process failed'}
+                    for _ in shard
+                )
+                continue
+            with open(blend_path + '.json', 'r') as f:
+                shard_results = json.load(f)
+            # Pull back only the materials this worker reports creating; a
+            # blanket import would also drag in the worker's fake-user
+            # template and any factory-startup defaults
+            created = {r.get('material_name') for r in shard_results if r.get('success')}
+            with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
+                data_to.materials = [name for name in data_from.materials if name in created]
+            results.extend(shard_results)
+        return results
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def create_materials(options_list: List[Dict[str, Any]], allow_parallel: bool = True) -> List[Dict[str, Any]]:
+    """
+    Create a batch of materials in one process
+
+    One Blender invocation amortizes interpreter and bpy startup across
+    the whole batch, and the interface lock defers depsgraph/UI refreshes
+    until every material is built instead of once per material.
+
+    Args:
+        options_list: List of option dictionaries, one per material
+        allow_parallel: Permit sharding large batches across worker
+            processes; workers pass False so shards never re-shard
+
+    Returns:
+        List of result dictionaries, one per material
+    """
+    # Large batches shard across worker processes when a Blender binary
+    # is available to host them
+    if allow_parallel and len(options_list) >= 2 * _PARALLEL_BATCH_MIN and getattr(bpy.app, 'binary_path', ''):
+        return _create_materials_parallel(options_list)
+
+    render = bpy.context.scene.render
+    previous_lock = render.use_lock_interface
+    render.use_lock_interface = True
+    try:
+        if hasattr(bpy.context, 'temp_override'):
+            # Suppress UI callback dispatch while the batch runs
+            with bpy.context.temp_override(window=None):
+                return [create_material(options) for options in options_list]
+        return [create_material(options) for options in options_list]
+    finally:
+        render.use_lock_interface = previous_lock
 
 def assign_texture(material_name: str, texture_path: str, texture_type: str) -> Dict[str, Any]:
     """
@@ -158,79 +499,145 @@ def assign_texture(material_name: str, texture_path: str, texture_type: str) ->
     Returns:
         Dictionary with result information
     """
+    # Same deferral as create_material: edits run behind a locked
+    # interface and the tree is tagged once after wiring
+    render = bpy.context.scene.render
+    previous_lock = render.use_lock_interface
+    render.use_lock_interface = True
     try:
-        mat = bpy.data.materials.get(material_name)
+        mat = _get_mat(material_name)
         if not mat:
             return {
                 'success': False,
                 'message': 'Material not found'
             }
-        
+
         if not mat.use_nodes:
             mat.use_nodes = True
         
         nodes = mat.node_tree.nodes
         links = mat.node_tree.links
         
-        # Find Principled BSDF
-        principled = None
-        for node in nodes:
-            if node.type == 'BSDF_PRINCIPLED':
-                principled = node
-                break
-        
+        # One pass gives us the Principled node, existing texture nodes,
+        # and the outputs the displacement branch needs
+        principled, tex_images, outputs = _classify(nodes)
+
         if not principled:
             return {
                 'success': False,
                 'message': 'No Principled BSDF found'
             }
+
+        # Re-binding the same file reuses the existing texture node
+        # instead of leaving an orphan for optimize_material to collect
+        img = _load_image(texture_path)
+        tex = next((node for node in tex_images if node.image == img), None)
+        if tex is None:
+            tex = nodes.new('ShaderNodeTexImage')
+            tex.image = img
+        if texture_type in _NON_COLOR_TYPES:
+            img.colorspace_settings.name = 'Non-Color'
+
+        # Connect based on texture type via the precomputed handler table
+        handler = _ASSIGN_HANDLERS.get(texture_type)
+        if handler:
+            input_name, intermediate = handler
+            tex_color = tex.outputs['Color']
+            principled_inputs = principled.inputs
+            if intermediate is None:
+                links.new(tex_color, principled_inputs[input_name])
+            elif texture_type == 'normal':
+                # Pooled lookup first (O(1) by name on repeat calls), then
+                # adopt a NormalMap already in the tree; relinking its
+                # Color input is cheaper than creating a duplicate node
+                normal_map = _pooled_node(nodes, mat.name, 'normal_map', intermediate, _NORMAL_MAP)
+                links.new(tex_color, normal_map.inputs['Color'])
+                links.new(normal_map.outputs['Normal'], principled_inputs['Normal'])
+            elif texture_type == 'displacement':
+                disp = _pooled_node(nodes, mat.name, 'displacement', intermediate, _DISPLACEMENT)
+                links.new(tex_color, disp.inputs['Height'])
+                if outputs:
+                    links.new(disp.outputs['Displacement'], outputs[0].inputs['Displacement'])
+            else:  # ao
+                # One pass over the link list builds a socket index; each probe
+                # is then an O(1) dict hit instead of a full-tree link scan
+                incoming = {
+                    (link.to_node.as_pointer(), link.to_socket.identifier): link
+                    for link in links
+                }
+                existing = incoming.get((principled.as_pointer(), _BASE_COLOR))
+                if existing is not None:
+                    mix_rgb = _pooled_node(nodes, mat.name, 'ao_mix', intermediate, _MIX_RGB)
+                    mix_rgb.blend_type = 'MULTIPLY'
+                    links.new(tex_color, mix_rgb.inputs[2])
+                    links.new(existing.from_socket, mix_rgb.inputs[1])
+                    links.new(mix_rgb.outputs['Color'], principled_inputs[_BASE_COLOR])
+                else:
+                    # Nothing feeds Base Color yet, so skip the MixRGB and
+                    # wire AO straight in
+                    links.new(tex_color, principled_inputs[_BASE_COLOR])
         
-        # Create texture node
-        tex = nodes.new('ShaderNodeTexImage')
-        tex.image = bpy.data.images.load(texture_path)
-        
-        # Connect based on texture type
-        if texture_type == 'albedo':
-            links.new(tex.outputs['Color'], principled.inputs['Base Color'])
-        elif texture_type == 'normal':
-            normal_map = nodes.new('ShaderNodeNormalMap')
-            links.new(tex.outputs['Color'], normal_map.inputs['Color'])
-            links.new(normal_map.outputs['Normal'], principled.inputs['Normal'])
-        elif texture_type == 'roughness':
-            links.new(tex.outputs['Color'], principled.inputs['Roughness'])
-        elif texture_type == 'metallic':
-            links.new(tex.outputs['Color'], principled.inputs['Metallic'])
-        elif texture_type == 'ao':
-            mix_rgb = nodes.new('ShaderNodeMixRGB')
-            mix_rgb.blend_type = 'MULTIPLY'
-            links.new(tex.outputs['Color'], mix_rgb.inputs[2])
-            # Find existing albedo connection
-            for link in links:
-                if link.to_node == principled and link.to_socket.name == 'Base Color':
-                    links.new(link.from_socket, mix_rgb.inputs[1])
-                    links.new(mix_rgb.outputs['Color'], principled.inputs['Base Color'])
-                    break
-        elif texture_type == 'emission':
-            links.new(tex.outputs['Color'], principled.inputs['Emission Color'])
-        elif texture_type == 'displacement':
-            disp = nodes.new('ShaderNodeDisplacement')
-            links.new(tex.outputs['Color'], disp.inputs['Height'])
-            # Find Material Output
-            for node in nodes:
-                if node.type == 'OUTPUT_MATERIAL':
-                    links.new(disp.outputs['Displacement'], node.inputs['Displacement'])
-                    break
-        
+        mat.node_tree.update_tag()
+
         return {
             'success': True,
             'message': 'Texture assigned successfully'
         }
-        
+
     except Exception as e:
         return {
             'success': False,
             'message': f'Failed to assign texture: {str(e)}'
         }
+    finally:
+        render.use_lock_interface = previous_lock
+
+def finalize_material(material_name: str) -> Dict[str, Any]:
+    """
+    Attach texture datablocks deferred by create_material
+
+    Materials created with options['defer_textures'] carry only path
+    strings in custom properties; calling this right before render (or
+    export) performs the image loads that were skipped during authoring.
+
+    Args:
+        material_name: Name of the material to finalize
+
+    Returns:
+        Dictionary with result information
+    """
+    try:
+        mat = _get_mat(material_name)
+        if not mat:
+            return {
+                'success': False,
+                'message': 'Material not found'
+            }
+
+        attached = []
+        for opt_key in _TEXTURE_OPTION_KEYS:
+            prop = 'tahlia_deferred_' + opt_key
+            path = mat.get(prop)
+            if not path:
+                continue
+            texture_type = opt_key[:-len('_texture')]
+            result = assign_texture(material_name, path, texture_type)
+            if not result['success']:
+                return result
+            del mat[prop]
+            attached.append(texture_type)
+
+        return {
+            'success': True,
+            'attached': attached,
+            'message': 'Deferred textures attached'
+        }
+
+    except Exception as e:
+        return {
+            'success': False,
+            'message': f'Failed to finalize material: {str(e)}'
+        }
 
 def load_texture_info(texture_path: str) -> Dict[str, Any]:
     """
@@ -243,7 +650,14 @@ def load_texture_info(texture_path: str) -> Dict[str, Any]:
         Dictionary with texture information
     """
     try:
-        img = bpy.data.images.load(texture_path)
+        # PNG answers come from a 26-byte header read; loading through bpy
+        # decodes the whole file just to report dimensions
+        if texture_path.lower().endswith('.png'):
+            info = _png_header(texture_path)
+            if info is not None:
+                return info
+
+        img = _load_image(texture_path)
         return {
             'success': True,
             'width': img.size[0],
@@ -258,6 +672,58 @@ def load_texture_info(texture_path: str) -> Dict[str, Any]:
             'message': f'Failed to load texture: {str(e)}'
         }
 
+def _classify(nodes) -> tuple:
+    """
+    Split a node collection into the pieces validation and optimization need
+
+    One pass over the RNA collection instead of a separate scan per node
+    type.
+
+    Args:
+        nodes: A material node tree's nodes collection
+
+    Returns:
+        Tuple of (principled node or None, texture image nodes, output nodes)
+    """
+    principled = None
+    tex_images = []
+    outputs = []
+    for node in nodes:
+        node_type = node.type
+        if node_type == _PRINCIPLED:
+            principled = node
+        elif node_type == _TEX_IMAGE:
+            tex_images.append(node)
+        elif node_type == _OUTPUT_MATERIAL:
+            outputs.append(node)
+    return principled, tex_images, outputs
+
+def _png_header(texture_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Read PNG dimensions and channels from the IHDR chunk alone
+
+    Args:
+        texture_path: Path to the PNG file
+
+    Returns:
+        Texture info dictionary, or None if the file is not a valid PNG
+    """
+    with open(texture_path, 'rb') as f:
+        header = f.read(26)
+    if len(header) < 26 or header[:8] != b'\x89PNG\r\n\x1a\n':
+        return None
+    width, height = struct.unpack('>II', header[16:24])
+    color_type = header[25]
+    channels = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}.get(color_type, 4)
+    return {
+        'success': True,
+        'width': width,
+        'height': height,
+        'channels': channels,
+        'file_format': 'PNG',
+        'is_hdr': False
+    }
+
 def validate_material(material_name: str) -> Dict[str, Any]:
     """
     Validate material settings and texture assignments
@@ -269,7 +735,7 @@ def validate_material(material_name: str) -> Dict[str, Any]:
         Dictionary with validation results
     """
     try:
-        mat = bpy.data.materials.get(material_name)
+        mat = _get_mat(material_name)
         if not mat:
             return {
                 'success': False,
@@ -281,29 +747,18 @@ def validate_material(material_name: str) -> Dict[str, Any]:
         if not mat.use_nodes:
             issues.append('Material does not use nodes')
         else:
-            nodes = mat.node_tree.nodes
-            links = mat.node_tree.links
-            
-            # Check for Principled BSDF
-            principled = None
-            for node in nodes:
-                if node.type == 'BSDF_PRINCIPLED':
-                    principled = node
-                    break
-            
+            # One classification pass answers both checks
+            principled, texture_nodes, _ = _classify(mat.node_tree.nodes)
+
             if not principled:
                 issues.append('No Principled BSDF found')
-            
-            # Check texture nodes
-            texture_nodes = []
-            for node in nodes:
-                if node.type == 'TEX_IMAGE':
-                    texture_nodes.append(node)
-                    if not node.image:
-                        issues.append(f'Texture node has no image: {node.name}')
-                    elif not node.image.filepath:
-                        issues.append(f'Texture image has no filepath: {node.name}')
-            
+
+            for node in texture_nodes:
+                if not node.image:
+                    issues.append(f'Texture node has no image: {node.name}')
+                elif not node.image.filepath:
+                    issues.append(f'Texture image has no filepath: {node.name}')
+
             if not texture_nodes:
                 issues.append('No texture nodes found')
         
@@ -336,7 +791,7 @@ def optimize_material(material_name: str) -> Dict[str, Any]:
         Dictionary with optimization results
     """
     try:
-        mat = bpy.data.materials.get(material_name)
+        mat = _get_mat(material_name)
         if not mat:
             return {
                 'success': False,
@@ -348,34 +803,53 @@ def optimize_material(material_name: str) -> Dict[str, Any]:
         if mat.use_nodes:
             nodes = mat.node_tree.nodes
             links = mat.node_tree.links
-            
+
+            # One classification pass feeds both the removal and the
+            # texture-node tweaks below
+            _, tex_images, _ = _classify(nodes)
+
             # Remove unused nodes
             used_nodes = set()
             for link in links:
                 used_nodes.add(link.from_node)
                 used_nodes.add(link.to_node)
-            
-            nodes_to_remove = []
-            for node in nodes:
-                if node not in used_nodes and node.type != 'OUTPUT_MATERIAL':
-                    nodes_to_remove.append(node)
-            
-            for node in nodes_to_remove:
-                nodes.remove(node)
+
+            nodes_to_remove = [
+                node for node in nodes
+                if node not in used_nodes and node.type != _OUTPUT_MATERIAL
+            ]
+            removed = set(nodes_to_remove)
+            # Reverse order keeps each nodes.remove from reshuffling the
+            # indices of victims still waiting their turn
+            for node in reversed(nodes_to_remove):
+                # Record the name before removal invalidates the node
                 optimizations.append(f'Removed unused node: {node.name}')
-            
-            # Optimize texture nodes
-            for node in nodes:
-                if node.type == 'TEX_IMAGE' and node.image:
-                    # Set texture interpolation to linear for better performance
+                nodes.remove(node)
+
+            # Optimize texture nodes; every assignment crosses the RNA
+            # boundary and can tag image updates, so values already in the
+            # target state are left untouched
+            for node in tex_images:
+                if node in removed or not node.image:
+                    continue
+                changed = False
+
+                # Set texture interpolation to linear for better performance
+                if node.interpolation != 'Linear':
                     node.interpolation = 'Linear'
-                    
-                    # Set texture extension to repeat for better tiling
+                    changed = True
+
+                # Set texture extension to repeat for better tiling
+                if node.extension != 'REPEAT':
                     node.extension = 'REPEAT'
-                    
-                    # Enable mipmaps for better performance
+                    changed = True
+
+                # Enable mipmaps for better performance
+                if node.image.use_auto_refresh:
                     node.image.use_auto_refresh = False
-                    
+                    changed = True
+
+                if changed:
                     optimizations.append(f'Optimized texture node: {node.name}')
         
         return {
@@ -390,35 +864,71 @@ def optimize_material(material_name: str) -> Dict[str, Any]:
         }
 
 if __name__ == "__main__":
-    # Handle command line arguments for C++ integration
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
-        
+    # Handle command line arguments for C++ integration. A full Blender
+    # binary forwards script arguments after '--'; the bpy module passes
+    # them directly
+    if "--" in sys.argv:
+        _argv = sys.argv[sys.argv.index("--") + 1:]
+    else:
+        _argv = sys.argv[1:]
+
+    if _argv:
+        command = _argv[0]
+
+        # Stale datablock references must not leak across commands
+        _MAT_CACHE.clear()
+        _NODE_POOL.clear()
+
         if command == "create_material":
             # Read options from stdin or file
-            options_str = sys.argv[2] if len(sys.argv) > 2 else "{}"
-            options = json.loads(options_str)
+            options_str = _argv[1] if len(_argv) > 1 else "{}"
+            options = _loads(options_str)
             result = create_material(options)
-            print(json.dumps(result))
-            
+            _print_json(result)
+
+        elif command == "create_materials":
+            # JSON array of option dicts; one process builds the whole batch
+            options_str = _argv[1] if len(_argv) > 1 else "[]"
+            options_list = _loads(options_str)
+            results = create_materials(options_list)
+            _print_json(results)
+
+        elif command == "create_materials_blend":
+            # Worker mode for the parallel batch: read the shard options
+            # from the temp file the parent wrote, build it, save it to
+            # the given .blend, and leave the results JSON next to it;
+            # allow_parallel=False keeps big shards from re-sharding into
+            # grandchild Blender processes
+            with open(_argv[1], 'r') as f:
+                options_list = json.load(f)
+            results = create_materials(options_list, allow_parallel=False)
+            bpy.ops.wm.save_as_mainfile(filepath=_argv[2])
+            with open(_argv[2] + '.json', 'w') as f:
+                f.write(json.dumps(results))
+
         elif command == "assign_texture":
-            material_name = sys.argv[2]
-            texture_path = sys.argv[3]
-            texture_type = sys.argv[4]
+            material_name = _argv[1]
+            texture_path = _argv[2]
+            texture_type = _argv[3]
             result = assign_texture(material_name, texture_path, texture_type)
-            print(json.dumps(result))
-            
+            _print_json(result)
+
+        elif command == "finalize_material":
+            material_name = _argv[1]
+            result = finalize_material(material_name)
+            _print_json(result)
+
         elif command == "load_texture":
-            texture_path = sys.argv[2]
+            texture_path = _argv[1]
             result = load_texture_info(texture_path)
-            print(json.dumps(result))
-            
+            _print_json(result)
+
         elif command == "validate_material":
-            material_name = sys.argv[2]
+            material_name = _argv[1]
             result = validate_material(material_name)
-            print(json.dumps(result))
-            
+            _print_json(result)
+
         elif command == "optimize_material":
-            material_name = sys.argv[2]
+            material_name = _argv[1]
             result = optimize_material(material_name)
-            print(json.dumps(result)) 
\ No newline at end of file
+            _print_json(result) 
\ No newline at end of file
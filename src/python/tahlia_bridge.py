@@ -8,34 +8,166 @@ Description: Python bridge module that provides the interface between C++ core a
 """
 
 import bpy
-import bmesh
-import mathutils
-import json
+import collections
 import os
 import sys
+import types
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any, Union
 from pathlib import Path
 import logging
-import traceback
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Handler configuration is deferred to set_debug_mode: Blender re-imports
+# bridge modules per run, and import time should not pay for logging setup
+# (errors still reach stderr through logging's last-resort handler)
 logger = logging.getLogger(__name__)
 
+# (options key, Principled socket) pairs applied in one table walk instead
+# of a per-socket if/elif ladder: each key is probed once with options.get
+# and sockets are resolved with inputs.get so renamed inputs across Blender
+# versions degrade to a skip instead of a KeyError
+_PRINCIPLED_SCALAR_INPUTS = (
+    (sys.intern('metallic'), 'Metallic'),
+    (sys.intern('roughness'), 'Roughness'),
+    (sys.intern('specular'), 'Specular'),
+    (sys.intern('ior'), 'IOR'),
+    (sys.intern('transmission'), 'Transmission'),
+    (sys.intern('alpha'), 'Alpha'),
+)
+_PBR_SCALAR_INPUTS = _PRINCIPLED_SCALAR_INPUTS + (
+    (sys.intern('emission_strength'), 'Emission Strength'),
+    (sys.intern('subsurface'), 'Subsurface'),
+)
+
+def _parse_color(s: str, _cache: Dict[str, Tuple[float, ...]] = {}) -> Tuple[float, ...]:
+    """
+    Parse a comma-separated color string (e.g. "1.0,0.5,0.2") into an RGBA
+    tuple. Batch imports repeat the same handful of color strings, so
+    results are memoized; the cache is wiped at 256 entries to stay bounded.
+    """
+    value = _cache.get(s)
+    if value is None:
+        value = tuple(float(x) for x in s.split(',')) + (1.0,)
+        if len(_cache) >= 256:
+            _cache.clear()
+        _cache[s] = value
+    return value
+
+def _apply_principled_options(principled: Any, options: Dict[str, str],
+                              pairs: Tuple[Tuple[str, str], ...]) -> None:
+    """Apply scalar material options to a Principled BSDF in one table pass."""
+    inputs_get = principled.inputs.get
+    for opt_key, input_name in pairs:
+        value = options.get(opt_key)
+        if value is None:
+            continue
+        socket = inputs_get(input_name)
+        if socket is not None:
+            socket.default_value = float(value)
+
+@functools.lru_cache(maxsize=None)
+def _supported_formats_blender() -> Dict[str, Tuple[str, ...]]:
+    """Build the supported-formats table once per session (read-only view)."""
+    return types.MappingProxyType({
+        'models': ('.blend', '.obj', '.fbx', '.dae', '.3ds', '.stl', '.ply'),
+        'textures': ('.png', '.jpg', '.jpeg', '.tga', '.tiff', '.bmp', '.exr', '.hdr'),
+        'audio': ('.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a'),
+        'video': ('.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv')
+    })
+
+_TEXTURE_TEMPLATE_NAME = 'TahliaTextureTemplate'
+
+def _texture_template() -> Any:
+    """
+    Lazily build the texture-import template material: a Principled BSDF
+    with an Image Texture node wired to Base Color. Texture imports copy
+    this datablock — a fast data-level copy — and only swap the image,
+    instead of rebuilding the same node tree from scratch per file.
+    """
+    template = bpy.data.materials.get(_TEXTURE_TEMPLATE_NAME)
+    if template is None:
+        template = bpy.data.materials.new(name=_TEXTURE_TEMPLATE_NAME)
+        template.use_nodes = True
+        nodes = template.node_tree.nodes
+        tex = nodes.new('ShaderNodeTexImage')
+        tex.name = 'Image Texture'
+        principled = nodes.get('Principled BSDF')
+        if principled is not None:
+            template.node_tree.links.new(tex.outputs['Color'],
+                                         principled.inputs['Base Color'])
+        # Survives orphan purges even with no users yet
+        template.use_fake_user = True
+    return template
+
+def pack_string_list(items: List[str]) -> bytes:
+    """
+    Encode a list of names as one NUL-delimited byte buffer for the C++
+    boundary. A single parse on the native side replaces the old
+    join-then-split round trip, and NUL cannot appear in Blender names.
+
+    Args:
+        items: Names to encode
+
+    Returns:
+        UTF-8 bytes with NUL separators (empty bytes for an empty list)
+    """
+    return b'\0'.join(item.encode('utf-8') for item in items)
+
+# Shared empty payloads for error results. Error dicts are read-only by
+# convention on both sides of the bridge, so every failure can carry the
+# same two objects instead of allocating a fresh dict and list each time.
+_EMPTY_DATA: Dict[str, str] = {}
+_EMPTY_LIST: List[str] = []
+
 class TahliaBridge:
     """
     Python bridge implementation that provides the actual Blender API integration.
     This class implements the methods that the C++ PythonBridge class calls.
     """
-    
+
+    # Fixed attribute layout: no per-instance __dict__, and attribute
+    # access on the hot bridge paths skips a dict lookup level
+    __slots__ = ('context_stack', 'debug_mode', 'context_preservation',
+                 'max_context_stack_size', 'last_error', '_importers',
+                 '_texture_exts', '_ctx_cache_token', '_ctx_cache',
+                 '_has_shading', '_has_overlay', '_image_cache')
+
     def __init__(self):
         """Initialize the Tahlia bridge."""
-        self.context_stack = []
+        # Bounded deque: O(1) append/pop with no list resizing; maxlen is
+        # kept in sync with max_context_stack_size
+        self.context_stack = collections.deque(maxlen=10)
         self.debug_mode = False
         self.context_preservation = True
         self.max_context_stack_size = 10
         self.last_error = ""
-        
+
+        # Extension dispatch built once: O(1) dict probe per import instead
+        # of re-running an if/elif ladder of string comparisons
+        self._importers = {
+            '.blend': self._import_blend_file_blender,
+            '.obj': self._import_obj_file_blender,
+            '.fbx': self._import_fbx_file_blender,
+            '.dae': self._import_dae_file_blender,
+        }
+        self._texture_exts = frozenset(_supported_formats_blender()['textures'])
+
+        # Viewport capabilities resolved once against the RNA type rather
+        # than hasattr-probing space_data on every capture/restore
+        self._has_shading = hasattr(bpy.types.SpaceView3D, 'shading')
+        self._has_overlay = hasattr(bpy.types.SpaceView3D, 'overlay')
+
+        # Last capture_context snapshot plus the cheap state token it was
+        # taken under; repeated captures of an unchanged scene reuse it
+        self._ctx_cache_token = None
+        self._ctx_cache = None
+
+        # realpath -> Image datablock, so symlinked/relative spellings of
+        # the same file skip even the check_existing path scan in
+        # bpy.data.images.load; bounded to keep long sessions flat
+        self._image_cache = {}
+
         logger.info("TahliaBridge initialized")
     
     def capture_context(self) -> Dict[str, Any]:
@@ -46,9 +178,21 @@ class TahliaBridge:
             Dict containing the current Blender context state
         """
         try:
+            selected = [obj.name for obj in bpy.context.selected_objects]
+            active = bpy.context.active_object.name if bpy.context.active_object else ""
+            # Cheap state token: when it matches the previous capture, the
+            # viewport/collection/custom sub-captures are skipped and the
+            # cached snapshot is reused (selection and active object are
+            # tracked exactly; secondary state rides on this heuristic)
+            token = (bpy.context.scene.name, bpy.context.mode, active, tuple(selected))
+            if token == self._ctx_cache_token:
+                context = dict(self._ctx_cache)
+                context['selected_objects'] = selected
+                return context
+
             context = {
-                'selected_objects': [obj.name for obj in bpy.context.selected_objects],
-                'active_object': bpy.context.active_object.name if bpy.context.active_object else "",
+                'selected_objects': selected,
+                'active_object': active,
                 'view_layer': bpy.context.view_layer.name,
                 'mode': bpy.context.mode,
                 'viewport_settings': self._capture_viewport_settings(),
@@ -56,21 +200,60 @@ class TahliaBridge:
                 'is_rendering': bpy.context.scene.render.is_rendering,
                 'custom_state': self._capture_custom_state()
             }
-            return context
+            self._ctx_cache_token = token
+            self._ctx_cache = context
+            # Callers own their snapshot; hand out a copy so mutating it
+            # cannot corrupt the cache
+            return dict(context)
         except Exception as e:
             self.last_error = f"Failed to capture context: {e}"
             logger.error(self.last_error)
             return {}
     
+    def capture_context_packed(self) -> Tuple:
+        """
+        Capture the current context as a flat positional tuple.
+
+        Fixed index-addressed layout for the C++ boundary, so the consumer
+        unpacks by position instead of hashing string keys on a nested dict:
+        (selected_names, active_name, view_layer, mode, viewport_shading,
+        viewport_overlay, collections, is_rendering, scene_name,
+        frame_current, render_engine). Empty tuple on capture failure.
+
+        Returns:
+            Flat tuple of context state in the fixed layout above
+        """
+        context = self.capture_context()
+        if not context:
+            return ()
+        viewport = context.get('viewport_settings', {})
+        custom = context.get('custom_state', {})
+        return (
+            tuple(context['selected_objects']),
+            context['active_object'],
+            context['view_layer'],
+            context['mode'],
+            viewport.get('shading', ''),
+            viewport.get('overlay', ''),
+            tuple(context['visible_collections']),
+            context['is_rendering'],
+            custom.get('scene_name', ''),
+            custom.get('frame_current', ''),
+            custom.get('render_engine', ''),
+        )
+
     def _capture_viewport_settings(self) -> Dict[str, str]:
         """Capture viewport settings."""
         settings = {}
         try:
-            if hasattr(bpy.context.space_data, 'shading'):
-                settings['shading'] = bpy.context.space_data.shading.type
-            if hasattr(bpy.context.space_data, 'overlay'):
-                settings['overlay'] = 'WIREFRAME' if bpy.context.space_data.overlay.show_wireframes else 'SOLID'
-        except:
+            space = bpy.context.space_data
+            if space is not None:
+                if self._has_shading:
+                    settings['shading'] = space.shading.type
+                if self._has_overlay:
+                    settings['overlay'] = 'WIREFRAME' if space.overlay.show_wireframes else 'SOLID'
+        except (AttributeError, ReferenceError):
+            # Non-3D-view spaces lack these attributes; nothing to capture
             pass
         return settings
     
@@ -103,19 +286,43 @@ class TahliaBridge:
             True if restoration successful, False otherwise
         """
         try:
-            # Restore active object
-            if context.get('active_object'):
-                if context['active_object'] in bpy.data.objects:
-                    bpy.context.view_layer.objects.active = bpy.data.objects[context['active_object']]
-            
-            # Restore selected objects
+            # Fast path: when the snapshot's core state already matches the
+            # live context — the common case for nested preserve_context
+            # calls whose operation never touched context — skip the whole
+            # restore. Selection order is irrelevant, hence the sort.
+            current_active = bpy.context.active_object.name if bpy.context.active_object else ""
+            if (tuple(sorted(context.get('selected_objects', ()))),
+                    context.get('active_object', ''),
+                    context.get('mode', '')) == (
+                    tuple(sorted(obj.name for obj in bpy.context.selected_objects)),
+                    current_active,
+                    bpy.context.mode):
+                return True
+
+            # One name->object map instead of a bpy.data.objects scan per name
+            name_map = {obj.name: obj for obj in bpy.data.objects}
+
+            # Restore active object (skip the dep-graph poke when unchanged)
+            active_name = context.get('active_object')
+            if active_name:
+                active_obj = name_map.get(active_name)
+                if active_obj is not None and bpy.context.view_layer.objects.active is not active_obj:
+                    bpy.context.view_layer.objects.active = active_obj
+
+            # Restore selected objects with direct data access: one pass of
+            # select_set over the view layer instead of the select_all
+            # operator, which pushes a full operator context and undo step.
+            # Selection has no writable RNA array in 2.8x+ (it is per view
+            # layer), so in place of a foreach_set bulk write we skip every
+            # object whose state already matches — each avoided select_set
+            # is an avoided RNA update
             if context.get('selected_objects'):
-                # Clear current selection
-                bpy.ops.object.select_all(action='DESELECT')
-                # Select objects from context
-                for obj_name in context['selected_objects']:
-                    if obj_name in bpy.data.objects:
-                        bpy.data.objects[obj_name].select_set(True)
+                wanted = set(context['selected_objects'])
+                view_objects = bpy.context.view_layer.objects
+                for obj in view_objects:
+                    state = obj.name in wanted
+                    if obj.select_get() != state:
+                        obj.select_set(state)
             
             # Restore mode
             if context.get('mode') and bpy.context.active_object:
@@ -139,9 +346,12 @@ class TahliaBridge:
     def _restore_viewport_settings(self, settings: Dict[str, str]) -> None:
         """Restore viewport settings."""
         try:
-            if hasattr(bpy.context.space_data, 'shading') and 'shading' in settings:
-                bpy.context.space_data.shading.type = settings['shading']
-        except:
+            shading = settings.get('shading')
+            if shading and self._has_shading:
+                space = bpy.context.space_data
+                if space is not None:
+                    space.shading.type = shading
+        except (AttributeError, ReferenceError):
             pass
     
     def _restore_visible_collections(self, collections: List[str]) -> None:
@@ -190,17 +400,19 @@ class TahliaBridge:
         """
         return len(self.context_stack)
     
-    def preserve_context(self, operation: callable) -> bool:
+    def preserve_context(self, operation: callable, *, readonly: bool = False) -> bool:
         """
         Execute an operation while preserving the current Blender context.
-        
+
         Args:
             operation: The operation to execute
-            
+            readonly: Declares that the operation does not touch
+                bpy.context; skips the snapshot and restore entirely
+
         Returns:
             True if operation successful, False otherwise
         """
-        if not self.context_preservation:
+        if readonly or not self.context_preservation:
             try:
                 operation()
                 return True
@@ -234,25 +446,122 @@ class TahliaBridge:
             if not os.path.exists(asset_path):
                 return self._create_error_result(f"Asset file not found: {asset_path}")
             
-            file_ext = Path(asset_path).suffix.lower()
-            
-            # Handle different file formats
-            if file_ext == '.blend':
-                return self._import_blend_file_blender(asset_path, options)
-            elif file_ext == '.obj':
-                return self._import_obj_file_blender(asset_path, options)
-            elif file_ext == '.fbx':
-                return self._import_fbx_file_blender(asset_path, options)
-            elif file_ext == '.dae':
-                return self._import_dae_file_blender(asset_path, options)
-            elif file_ext in ['.png', '.jpg', '.jpeg', '.tga', '.tiff', '.bmp', '.exr', '.hdr']:
+            # os.path.splitext instead of Path().suffix: no PurePath
+            # allocation per import
+            file_ext = os.path.splitext(asset_path)[1].lower()
+
+            # Handle different file formats via the precomputed dispatch table
+            importer = self._importers.get(file_ext)
+            if importer is not None:
+                return importer(asset_path, options)
+            if file_ext in self._texture_exts:
                 return self._import_texture_blender(asset_path, options)
-            else:
-                return self._create_error_result(f"Unsupported file format: {file_ext}")
+            return self._create_error_result(f"Unsupported file format: {file_ext}")
                 
         except Exception as e:
             return self._create_error_result(f"Import failed: {str(e)}")
     
+    def import_assets_blender(self, paths: List[str], options: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Import multiple assets in one batched pass.
+
+        Amortizes the per-file costs of import_asset_blender across the
+        whole batch: context capture/restore is paid once, .blend libraries
+        defer their scene links to a single final loop, and operator-based
+        formats are diffed against one pre-batch snapshot of bpy.data.objects
+        instead of relying on per-call selection state.
+
+        Args:
+            paths: Paths of the asset files to import
+            options: Import options shared by every file in the batch
+
+        Returns:
+            Dict containing the aggregated import result
+        """
+        try:
+            # The pre-import existence checks are pure I/O, so overlap the
+            # stat calls in a thread pool; everything touching bpy below
+            # stays single-threaded since Blender's data API is not
+            # thread-safe
+            if len(paths) > 1:
+                with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 4)) as pool:
+                    exists = list(pool.map(os.path.exists, paths))
+            else:
+                exists = [os.path.exists(p) for p in paths]
+
+            grouped: Dict[str, List[str]] = {}
+            missing = []
+            for path, present in zip(paths, exists):
+                if present:
+                    grouped.setdefault(os.path.splitext(path)[1].lower(), []).append(path)
+                else:
+                    missing.append(path)
+            if missing:
+                return self._create_error_result(f"Asset files not found: {', '.join(missing)}")
+
+            imported: List[str] = []
+            failures: List[str] = []
+            self.push_context()
+            try:
+                # .blend batch: load every library first, then link all the
+                # collected objects into the scene in one final loop
+                link = options.get('link', 'False').lower() == 'true'
+                pending = []
+                for path in grouped.pop('.blend', ()):
+                    try:
+                        with bpy.data.libraries.load(path, link=link) as (data_from, data_to):
+                            data_to.objects = data_from.objects
+                        pending.extend(data_to.objects)
+                    except Exception as e:
+                        failures.append(f"{path}: {e}")
+                scene_link = bpy.context.scene.collection.objects.link
+                for obj in pending:
+                    if obj is not None:
+                        scene_link(obj)
+                        imported.append(obj.name)
+
+                # Texture imports report materials, not objects, so they
+                # contribute their own result lists directly
+                for file_ext in list(grouped):
+                    if file_ext in self._texture_exts:
+                        for path in grouped.pop(file_ext):
+                            result = self._import_texture_blender(path, options)
+                            if result['success']:
+                                imported.extend(result['list_data'])
+                            else:
+                                failures.append(f"{path}: {result['message']}")
+
+                # Operator-based formats: snapshot object names once before
+                # the sub-batch and diff once after, rather than trusting
+                # per-call selection for attribution
+                if grouped:
+                    before = set(bpy.data.objects.keys())
+                    for file_ext, group in grouped.items():
+                        importer = self._importers.get(file_ext)
+                        if importer is None:
+                            failures.extend(f"{p}: unsupported format" for p in group)
+                            continue
+                        for path in group:
+                            result = importer(path, options)
+                            if not result['success']:
+                                failures.append(f"{path}: {result['message']}")
+                    imported.extend(sorted(set(bpy.data.objects.keys()) - before))
+            finally:
+                self.pop_context()
+
+            if failures and not imported:
+                return self._create_error_result(f"Batch import failed: {'; '.join(failures)}")
+            return self._create_success_result(
+                f"Imported {len(imported)} items from {len(paths)} files",
+                {
+                    'file_count': str(len(paths)),
+                    'failed_files': ';'.join(failures)
+                },
+                imported
+            )
+        except Exception as e:
+            return self._create_error_result(f"Batch import failed: {str(e)}")
+
     def _import_blend_file_blender(self, asset_path: str, options: Dict[str, str]) -> Dict[str, Any]:
         """Import a Blender file using Blender's library system."""
         try:
@@ -262,17 +571,19 @@ class TahliaBridge:
                 # Import all objects
                 data_to.objects = data_from.objects
             
-            # Add objects to the scene
+            # Add objects to the scene; resolve the RNA property chain and
+            # bound methods once instead of per object in the loop
             imported_objects = []
+            link_to_scene = bpy.context.scene.collection.objects.link
+            record = imported_objects.append
             for obj in data_to.objects:
                 if obj is not None:
-                    bpy.context.scene.collection.objects.link(obj)
-                    imported_objects.append(obj.name)
+                    link_to_scene(obj)
+                    record(obj.name)
             
             return self._create_success_result(
                 f"Imported {len(imported_objects)} objects from {asset_path}",
                 {
-                    'imported_objects': ','.join(imported_objects),
                     'file_path': asset_path,
                     'file_type': 'blend'
                 },
@@ -303,7 +614,6 @@ class TahliaBridge:
             return self._create_success_result(
                 f"Imported OBJ file: {asset_path}",
                 {
-                    'imported_objects': ','.join(imported_objects),
                     'file_path': asset_path,
                     'file_type': 'obj'
                 },
@@ -322,7 +632,6 @@ class TahliaBridge:
             return self._create_success_result(
                 f"Imported FBX file: {asset_path}",
                 {
-                    'imported_objects': ','.join(imported_objects),
                     'file_path': asset_path,
                     'file_type': 'fbx'
                 },
@@ -341,7 +650,6 @@ class TahliaBridge:
             return self._create_success_result(
                 f"Imported Collada file: {asset_path}",
                 {
-                    'imported_objects': ','.join(imported_objects),
                     'file_path': asset_path,
                     'file_type': 'dae'
                 },
@@ -350,26 +658,39 @@ class TahliaBridge:
         except Exception as e:
             return self._create_error_result(f"Failed to import Collada file: {e}")
     
+    def _load_image_cached(self, asset_path: str) -> Any:
+        """
+        Load an image datablock through the realpath-keyed cache.
+
+        Cache hits skip bpy.data.images.load entirely; entries are
+        revalidated against bpy.data.images so a deleted datablock is
+        reloaded rather than handed out stale.
+        """
+        key = os.path.realpath(asset_path)
+        img = self._image_cache.get(key)
+        if img is None or img.name not in bpy.data.images:
+            img = bpy.data.images.load(asset_path, check_existing=True)
+            if len(self._image_cache) >= 256:
+                self._image_cache.clear()
+            self._image_cache[key] = img
+        return img
+
     def _import_texture_blender(self, asset_path: str, options: Dict[str, str]) -> Dict[str, Any]:
         """Import a texture file and create a material."""
         try:
             # Create a new material
-            material_name = options.get('material_name', Path(asset_path).stem)
-            material = bpy.data.materials.new(name=material_name)
-            material.use_nodes = True
-            
-            # Get the principled BSDF node
-            principled = material.node_tree.nodes.get('Principled BSDF')
-            if principled:
-                # Load the texture
-                texture_node = material.node_tree.nodes.new('ShaderNodeTexImage')
-                texture_node.image = bpy.data.images.load(asset_path)
-                
-                # Connect to base color
-                material.node_tree.links.new(
-                    texture_node.outputs['Color'],
-                    principled.inputs['Base Color']
-                )
+            material_name = (options.get('material_name')
+                             or os.path.splitext(os.path.basename(asset_path))[0])
+            material = _texture_template().copy()
+            material.name = material_name
+            material.use_fake_user = False
+
+            # The copy already carries the wired Image Texture node; just
+            # swap in the image, deduped so re-importing the same file
+            # reuses one datablock instead of decoding it again
+            texture_node = material.node_tree.nodes.get('Image Texture')
+            if texture_node is not None:
+                texture_node.image = self._load_image_cached(asset_path)
             
             return self._create_success_result(
                 f"Imported texture: {asset_path}",
@@ -395,6 +716,10 @@ class TahliaBridge:
             Dict containing the material creation result
         """
         try:
+            # Option keys arriving over the FFI are fresh strings; intern
+            # them once so every table probe below is a pointer-equality hit
+            options = {sys.intern(k): v for k, v in options.items()}
+
             material = bpy.data.materials.new(name=name)
             material.use_nodes = True
             
@@ -402,22 +727,10 @@ class TahliaBridge:
             principled = material.node_tree.nodes.get('Principled BSDF')
             if principled:
                 # Apply material options
-                if 'metallic' in options:
-                    principled.inputs['Metallic'].default_value = float(options['metallic'])
-                if 'roughness' in options:
-                    principled.inputs['Roughness'].default_value = float(options['roughness'])
-                if 'base_color' in options:
-                    # Parse color (assuming format like "1.0,0.5,0.2")
-                    color_values = [float(x) for x in options['base_color'].split(',')]
-                    principled.inputs['Base Color'].default_value = (*color_values, 1.0)
-                if 'specular' in options:
-                    principled.inputs['Specular'].default_value = float(options['specular'])
-                if 'ior' in options:
-                    principled.inputs['IOR'].default_value = float(options['ior'])
-                if 'transmission' in options:
-                    principled.inputs['Transmission'].default_value = float(options['transmission'])
-                if 'alpha' in options:
-                    principled.inputs['Alpha'].default_value = float(options['alpha'])
+                _apply_principled_options(principled, options, _PRINCIPLED_SCALAR_INPUTS)
+                base_color = options.get('base_color')
+                if base_color:
+                    principled.inputs['Base Color'].default_value = _parse_color(base_color)
             
             return self._create_success_result(
                 f"Created material: {name}",
@@ -442,6 +755,10 @@ class TahliaBridge:
             Dict containing the material creation result
         """
         try:
+            # Option keys arriving over the FFI are fresh strings; intern
+            # them once so every table probe below is a pointer-equality hit
+            options = {sys.intern(k): v for k, v in options.items()}
+
             material = bpy.data.materials.new(name=name)
             material.use_nodes = True
             
@@ -449,22 +766,7 @@ class TahliaBridge:
             principled = material.node_tree.nodes.get('Principled BSDF')
             if principled:
                 # Apply PBR settings
-                if 'metallic' in options:
-                    principled.inputs['Metallic'].default_value = float(options['metallic'])
-                if 'roughness' in options:
-                    principled.inputs['Roughness'].default_value = float(options['roughness'])
-                if 'specular' in options:
-                    principled.inputs['Specular'].default_value = float(options['specular'])
-                if 'ior' in options:
-                    principled.inputs['IOR'].default_value = float(options['ior'])
-                if 'transmission' in options:
-                    principled.inputs['Transmission'].default_value = float(options['transmission'])
-                if 'alpha' in options:
-                    principled.inputs['Alpha'].default_value = float(options['alpha'])
-                if 'emission_strength' in options:
-                    principled.inputs['Emission Strength'].default_value = float(options['emission_strength'])
-                if 'subsurface' in options:
-                    principled.inputs['Subsurface'].default_value = float(options['subsurface'])
+                _apply_principled_options(principled, options, _PBR_SCALAR_INPUTS)
             
             return self._create_success_result(
                 f"Created PBR material: {name}",
@@ -477,19 +779,14 @@ class TahliaBridge:
         except Exception as e:
             return self._create_error_result(f"Failed to create PBR material: {e}")
     
-    def get_supported_formats_blender(self) -> Dict[str, List[str]]:
+    def get_supported_formats_blender(self) -> Dict[str, Tuple[str, ...]]:
         """
         Get the list of supported file formats in Blender.
         
         Returns:
             Dict containing supported formats by category
         """
-        return {
-            'models': ['.blend', '.obj', '.fbx', '.dae', '.3ds', '.stl', '.ply'],
-            'textures': ['.png', '.jpg', '.jpeg', '.tga', '.tiff', '.bmp', '.exr', '.hdr'],
-            'audio': ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a'],
-            'video': ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv']
-        }
+        return _supported_formats_blender()
     
     def _create_success_result(self, message: str, data: Dict[str, str], list_data: List[str]) -> Dict[str, Any]:
         """Create a success result."""
@@ -505,14 +802,18 @@ class TahliaBridge:
         return {
             'success': False,
             'message': message,
-            'data': {},
-            'list_data': []
+            'data': _EMPTY_DATA,
+            'list_data': _EMPTY_LIST
         }
     
     def set_debug_mode(self, enable: bool) -> None:
         """Enable or disable debug mode."""
+        if enable == self.debug_mode:
+            return
         self.debug_mode = enable
+        _supported_formats_blender.cache_clear()
         if enable:
+            logging.basicConfig(level=logging.DEBUG)
             logging.getLogger().setLevel(logging.DEBUG)
         else:
             logging.getLogger().setLevel(logging.INFO)
@@ -524,6 +825,9 @@ class TahliaBridge:
     def set_max_context_stack_size(self, max_size: int) -> None:
         """Set the maximum context stack size."""
         self.max_context_stack_size = max_size
+        # A deque's maxlen is immutable, so rebuild while keeping the
+        # newest contexts
+        self.context_stack = collections.deque(self.context_stack, maxlen=max_size)
     
     def get_last_error(self) -> str:
         """Get the last error message."""
@@ -541,6 +845,10 @@ def capture_context() -> Dict[str, Any]:
     """Capture the current Blender context."""
     return bridge.capture_context()
 
+def capture_context_packed() -> Tuple:
+    """Capture the current context as a flat positional tuple."""
+    return bridge.capture_context_packed()
+
 def restore_context(context: Dict[str, Any]) -> bool:
     """Restore a Blender context."""
     return bridge.restore_context(context)
@@ -565,10 +873,18 @@ def preserve_context(operation: callable) -> bool:
     """Preserve context during operation."""
     return bridge.preserve_context(operation)
 
+def preserve_context_readonly(operation: callable) -> bool:
+    """Run a context-read-only operation without snapshot/restore."""
+    return bridge.preserve_context(operation, readonly=True)
+
 def import_asset_blender(asset_path: str, options: Dict[str, str]) -> Dict[str, Any]:
     """Import an asset using Blender."""
     return bridge.import_asset_blender(asset_path, options)
 
+def import_assets_blender(paths: List[str], options: Dict[str, str]) -> Dict[str, Any]:
+    """Import multiple assets in one batched pass."""
+    return bridge.import_assets_blender(paths, options)
+
 def create_material_blender(name: str, options: Dict[str, str]) -> Dict[str, Any]:
     """Create a material using Blender."""
     return bridge.create_material_blender(name, options)
@@ -577,7 +893,7 @@ def create_pbr_material_blender(name: str, options: Dict[str, str]) -> Dict[str,
     """Create a PBR material using Blender."""
     return bridge.create_pbr_material_blender(name, options)
 
-def get_supported_formats_blender() -> Dict[str, List[str]]:
+def get_supported_formats_blender() -> Dict[str, Tuple[str, ...]]:
     """Get supported formats in Blender."""
     return bridge.get_supported_formats_blender()
 
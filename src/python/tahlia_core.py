@@ -10,23 +10,146 @@ Description: Main Python module for Tahlia asset management system.
 import bpy
 import bmesh
 import mathutils
+import functools
 import json
 import os
 import sys
+import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Module-local logger; handler configuration is the embedding
+# application's concern, not a module import side effect
 logger = logging.getLogger(__name__)
 
+
+# (options key, Principled input) pairs shared by the material creators:
+# one node lookup plus a table walk replaces re-resolving
+# node_tree.nodes['Principled BSDF'] and its inputs per option
+_PBR_MAP = (
+    ('metallic', 'Metallic'),
+    ('roughness', 'Roughness'),
+    ('specular', 'Specular'),
+    ('ior', 'IOR'),
+    ('transmission', 'Transmission'),
+    ('alpha', 'Alpha'),
+)
+
+def _parse_base_color(value: Any, _cache: Dict[str, Tuple[float, ...]] = {}) -> Tuple[float, ...]:
+    """
+    Normalize a base_color option into an RGBA tuple. Accepts either a
+    comma-separated string ("1.0,0.5,0.2") or an RGB sequence. String
+    parses are memoized since batch imports repeat the same handful of
+    colors; the cache is wiped at 256 entries to stay bounded.
+    """
+    if not isinstance(value, str):
+        rgb = tuple(map(float, value))
+        return rgb + (1.0,) if len(rgb) == 3 else rgb
+    rgba = _cache.get(value)
+    if rgba is None:
+        rgba = tuple(float(x) for x in value.split(',')) + (1.0,)
+        if len(_cache) >= 256:
+            _cache.clear()
+        _cache[value] = rgba
+    return rgba
+
+_MATERIAL_TEMPLATE_NAME = '_tahlia_template'
+
+def _material_template() -> Any:
+    """
+    Lazily build the base material template: a plain node material whose
+    default Principled BSDF tree Blender has already constructed. The
+    material creators copy this datablock — a fast data-level copy —
+    instead of paying for new() plus the use_nodes tree build per call.
+    """
+    template = bpy.data.materials.get(_MATERIAL_TEMPLATE_NAME)
+    if template is None:
+        template = bpy.data.materials.new(name=_MATERIAL_TEMPLATE_NAME)
+        template.use_nodes = True
+        # Survives orphan purges even with no users yet
+        template.use_fake_user = True
+    return template
+
+def _wrap_import(label: str):
+    """
+    Hoist the identical try/except boilerplate out of the _import_*
+    handlers: on failure, log the exception and return the standard
+    error payload with a per-format message.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(self, asset_path: str, options: Dict[str, str]) -> Dict[str, Any]:
+            try:
+                return fn(self, asset_path, options)
+            except Exception as e:
+                logger.error("%s failed: %s", fn.__name__, e)
+                return {
+                    'success': False,
+                    'message': f"Failed to import {label}: {e}",
+                    'data': {},
+                    'list_data': []
+                }
+        return wrapper
+    return decorate
+
+def positions_grid(rows: int, cols: int, spacing: float) -> np.ndarray:
+    """
+    Compute grid layout positions as a (rows*cols, 3) array.
+
+    Args:
+        rows: Number of rows
+        cols: Number of columns
+        spacing: Spacing between positions
+
+    Returns:
+        Array of (x, y, z) positions, row-major
+    """
+    xs, ys = np.meshgrid(np.arange(cols) * spacing, np.arange(rows) * spacing)
+    return np.stack([xs, ys, np.zeros_like(xs)], axis=-1).reshape(-1, 3)
+
+def positions_circle(n: int, radius: float) -> np.ndarray:
+    """
+    Compute circle layout positions as an (n, 3) array.
+
+    Args:
+        n: Number of positions on the circle
+        radius: Radius of the circle
+
+    Returns:
+        Array of (x, y, z) positions
+    """
+    angles = np.linspace(0.0, 2.0 * np.pi, n, endpoint=False)
+    return np.column_stack([np.cos(angles) * radius, np.sin(angles) * radius, np.zeros(n)])
+
+def positions_line(n: int, spacing: float) -> np.ndarray:
+    """
+    Compute line layout positions as an (n, 3) array.
+
+    Args:
+        n: Number of positions
+        spacing: Spacing between positions
+
+    Returns:
+        Array of (x, y, z) positions along the X axis
+    """
+    return np.column_stack([np.arange(n) * spacing, np.zeros(n), np.zeros(n)])
+
 class TahliaCore:
     """
     Main Python interface for Tahlia asset management system.
     Provides elegant APIs for asset importing, material creation, and history management.
     """
-    
+
+    # Class-level immutable format tables: O(1) hash membership in the
+    # import hot path and zero allocation per instance
+    _SUPPORTED_FORMATS = {
+        'models': frozenset(('.blend', '.obj', '.fbx', '.dae', '.3ds', '.stl', '.ply')),
+        'textures': frozenset(('.png', '.jpg', '.jpeg', '.tga', '.tiff', '.bmp', '.exr', '.hdr')),
+        'audio': frozenset(('.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a')),
+        'video': frozenset(('.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv')),
+    }
+
     def __init__(self):
         """Initialize the Tahlia core system."""
         self.asset_manager = None
@@ -38,42 +161,91 @@ class TahliaCore:
         self.context_preservation = True
         self.max_context_stack_size = 10
         
-        # Initialize Blender-specific settings
-        self.supported_formats = {
-            'models': ['.blend', '.obj', '.fbx', '.dae', '.3ds', '.stl', '.ply'],
-            'textures': ['.png', '.jpg', '.jpeg', '.tga', '.tiff', '.bmp', '.exr', '.hdr'],
-            'audio': ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a'],
-            'video': ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv']
+        # Initialize Blender-specific settings (shared class-level tables)
+        self.supported_formats = self._SUPPORTED_FORMATS
+
+        # Extension dispatch built once: a single dict probe per import
+        # instead of an if/elif ladder of string comparisons
+        # Keys are interned so the interned lookup in _perform_import
+        # resolves on pointer equality before falling back to compare
+        self._importers = {
+            sys.intern('.blend'): self._import_blend_file,
+            sys.intern('.obj'): self._import_obj_file,
+            sys.intern('.fbx'): self._import_fbx_file,
+            sys.intern('.dae'): self._import_dae_file,
         }
-        
+        self._texture_exts = self._SUPPORTED_FORMATS['textures']
+
+        # realpath -> Image datablock: O(1) reuse on repeat texture imports
+        # (check_existing=True dedupes too, but walks the whole image list)
+        self._image_cache: Dict[str, Any] = {}
+
+        # Retired context records recycled by push_context
+        self._ctx_freelist: List[Dict[str, Any]] = []
+
         logger.info("TahliaCore initialized successfully")
     
-    def capture_context(self) -> Dict[str, Any]:
+    def capture_context(self, out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Capture the current Blender context state.
-        
+
+        Args:
+            out: Optional recycled dict to populate in place (used by the
+                push_context freelist); a fresh dict is built when omitted
+
         Returns:
             Dict containing the current Blender context state
         """
         try:
-            context = {
-                'selected_objects': [obj.name for obj in bpy.context.selected_objects],
-                'active_object': bpy.context.active_object.name if bpy.context.active_object else "",
-                'view_layer': bpy.context.view_layer.name,
-                'mode': bpy.context.mode,
-                'viewport_settings': {
-                    'shading': bpy.context.space_data.shading.type if hasattr(bpy.context.space_data, 'shading') else 'SOLID',
-                    'overlay': 'WIREFRAME' if bpy.context.space_data.overlay.show_wireframes else 'SOLID'
-                },
-                'visible_collections': [col.name for col in bpy.context.scene.collection.children if col.hide_viewport == False],
-                'is_rendering': bpy.context.scene.render.is_rendering,
-                'custom_state': {}
-            }
+            # Bind the bpy.context attribute chains once; every reference
+            # below hits a local instead of a descriptor walk into RNA
+            ctx = bpy.context
+            scene = ctx.scene
+            space = ctx.space_data
+            shading = getattr(space, 'shading', None)
+            overlay = getattr(space, 'overlay', None)
+            active = ctx.active_object
+            context = out if out is not None else {}
+            # Keep the nested viewport dict across recycles too
+            viewport = context.get('viewport_settings')
+            if viewport is None:
+                viewport = {}
+            viewport['shading'] = shading.type if shading is not None else 'SOLID'
+            viewport['overlay'] = 'WIREFRAME' if overlay is not None and overlay.show_wireframes else 'SOLID'
+            context['selected_objects'] = [obj.name for obj in ctx.selected_objects]
+            context['active_object'] = active.name if active else ""
+            context['view_layer'] = ctx.view_layer.name
+            context['mode'] = ctx.mode
+            context['viewport_settings'] = viewport
+            context['visible_collections'] = [col.name for col in scene.collection.children if not col.hide_viewport]
+            context['is_rendering'] = scene.render.is_rendering
+            context['custom_state'] = {}
             return context
         except Exception as e:
-            logger.error(f"Failed to capture context: {e}")
+            logger.error("Failed to capture context: %s", e)
             return {}
     
+    def _capture_minimal(self) -> Dict[str, Any]:
+        """
+        Capture only the fields preserve_context actually restores.
+
+        The full capture_context materializes every selected-object and
+        collection name — the dominant allocation on big scenes — while the
+        wrap-one-operation path only needs the active object and mode.
+
+        Returns:
+            Dict with 'active_object' and 'mode', or empty dict on failure
+        """
+        try:
+            active = bpy.context.active_object
+            return {
+                'active_object': active.name if active else "",
+                'mode': bpy.context.mode,
+            }
+        except Exception as e:
+            logger.error("Failed to capture context: %s", e)
+            return {}
+
     def restore_context(self, context: Dict[str, Any]) -> bool:
         """
         Restore a previously captured Blender context state.
@@ -85,33 +257,48 @@ class TahliaCore:
             True if restoration successful, False otherwise
         """
         try:
-            # Restore active object
+            # Same local-binding treatment as capture_context: objs and ctx
+            # are resolved once rather than per name in the loops below
+            ctx = bpy.context
+            objs = bpy.data.objects
+
+            # Restore active object (.get collapses the membership test and
+            # the index into one name resolution)
             if context.get('active_object'):
-                if context['active_object'] in bpy.data.objects:
-                    bpy.context.view_layer.objects.active = bpy.data.objects[context['active_object']]
-            
-            # Restore selected objects
-            if context.get('selected_objects'):
-                for obj_name in context['selected_objects']:
-                    if obj_name in bpy.data.objects:
-                        bpy.data.objects[obj_name].select_set(True)
-            
+                active_obj = objs.get(context['active_object'])
+                if active_obj is not None:
+                    ctx.view_layer.objects.active = active_obj
+
+            # Restore selected objects. Object selection exposes no
+            # writable RNA array for foreach_set, so the next-best batching
+            # is differs-only writes: compare select_get first and call
+            # select_set only on objects whose state actually changes
+            selected = context.get('selected_objects')
+            if selected is not None:
+                wanted = set(selected)
+                for obj in ctx.view_layer.objects:
+                    state = obj.name in wanted
+                    if obj.select_get() != state:
+                        obj.select_set(state)
+
             # Restore mode
-            if context.get('mode') and bpy.context.active_object:
+            if context.get('mode') and ctx.active_object:
                 try:
                     bpy.ops.object.mode_set(mode=context['mode'])
                 except:
                     pass  # Mode might not be available
-            
-            # Restore viewport settings
-            if hasattr(bpy.context.space_data, 'shading') and context.get('viewport_settings'):
+
+            # Restore viewport settings (one getattr instead of hasattr
+            # followed by the same attribute walk again)
+            shading = getattr(ctx.space_data, 'shading', None)
+            if shading is not None and context.get('viewport_settings'):
                 settings = context['viewport_settings']
                 if 'shading' in settings:
-                    bpy.context.space_data.shading.type = settings['shading']
-            
+                    shading.type = settings['shading']
+
             return True
         except Exception as e:
-            logger.error(f"Failed to restore context: {e}")
+            logger.error("Failed to restore context: %s", e)
             return False
     
     def push_context(self) -> bool:
@@ -122,7 +309,10 @@ class TahliaCore:
             True if successful, False otherwise
         """
         if len(self.context_stack) < self.max_context_stack_size:
-            context = self.capture_context()
+            # Reuse a retired context record when one is available instead
+            # of allocating a fresh dict per push
+            recycled = self._ctx_freelist.pop() if self._ctx_freelist else None
+            context = self.capture_context(out=recycled)
             self.context_stack.append(context)
             return True
         return False
@@ -136,7 +326,12 @@ class TahliaCore:
         """
         if self.context_stack:
             context = self.context_stack.pop()
-            return self.restore_context(context)
+            restored = self.restore_context(context)
+            # Retire the fixed-shape record to the freelist for the next
+            # push; capped so the pool never outgrows the stack itself
+            if len(self._ctx_freelist) < self.max_context_stack_size:
+                self._ctx_freelist.append(context)
+            return restored
         return False
     
     def clear_context_stack(self) -> None:
@@ -156,13 +351,32 @@ class TahliaCore:
         if not self.context_preservation:
             operation()
             return True
-        
-        saved_context = self.capture_context()
+
+        # Snapshot/restore pair, capturing only what this path restores
+        # (push_context keeps the full capture). temp_override is not an
+        # option here: it would pin selected_objects/active_object for the
+        # whole block, so the operator-based importers — which read
+        # bpy.context.selected_objects right after the operator runs —
+        # would see the pre-operation selection, and it only overrides
+        # context resolution anyway, leaving real selection changes behind
+        pre_fingerprint = (
+            getattr(bpy.context.active_object, 'name', None),
+            bpy.context.mode,
+        )
+        saved_context = self._capture_minimal()
         try:
             operation()
+            # Most operations leave the active object and mode untouched;
+            # when the cheap fingerprint still matches, skip the restore
+            post_fingerprint = (
+                getattr(bpy.context.active_object, 'name', None),
+                bpy.context.mode,
+            )
+            if post_fingerprint == pre_fingerprint:
+                return True
             return self.restore_context(saved_context)
         except Exception as e:
-            logger.error(f"Operation failed: {e}")
+            logger.error("Operation failed: %s", e)
             self.restore_context(saved_context)
             return False
     
@@ -196,206 +410,206 @@ class TahliaCore:
         Returns:
             Dict containing the import result
         """
-        try:
-            if not os.path.exists(asset_path):
-                return {
-                    'success': False,
-                    'message': f"Asset file not found: {asset_path}",
-                    'data': {},
-                    'list_data': []
-                }
-            
-            file_ext = Path(asset_path).suffix.lower()
-            
-            # Handle different file formats
-            if file_ext == '.blend':
-                return self._import_blend_file(asset_path, options)
-            elif file_ext == '.obj':
-                return self._import_obj_file(asset_path, options)
-            elif file_ext == '.fbx':
-                return self._import_fbx_file(asset_path, options)
-            elif file_ext == '.dae':
-                return self._import_dae_file(asset_path, options)
-            elif file_ext in ['.png', '.jpg', '.jpeg', '.tga', '.tiff', '.bmp', '.exr', '.hdr']:
-                return self._import_texture(asset_path, options)
-            else:
-                return {
-                    'success': False,
-                    'message': f"Unsupported file format: {file_ext}",
-                    'data': {},
-                    'list_data': []
-                }
-                
-        except Exception as e:
-            logger.error(f"Import failed: {e}")
+        if not os.path.exists(asset_path):
             return {
                 'success': False,
-                'message': f"Import failed: {str(e)}",
+                'message': f"Asset file not found: {asset_path}",
                 'data': {},
                 'list_data': []
             }
-    
+
+        # splitext + intern beats constructing a Path per import, and the
+        # interned extension hits the dispatch dict by pointer equality
+        file_ext = sys.intern(os.path.splitext(asset_path)[1].lower())
+
+        # Handle different file formats via the precomputed dispatch table;
+        # per-format failures are caught inside the _wrap_import'd handlers
+        handler = self._importers.get(file_ext)
+        if handler is not None:
+            return handler(asset_path, options)
+        if file_ext in self._texture_exts:
+            return self._import_texture(asset_path, options)
+        return {
+            'success': False,
+            'message': f"Unsupported file format: {file_ext}",
+            'data': {},
+            'list_data': []
+        }
+
+    @_wrap_import('blend file')
     def _import_blend_file(self, asset_path: str, options: Dict[str, str]) -> Dict[str, Any]:
         """Import a Blender file."""
-        try:
-            # Link/append from the blend file
-            link = options.get('link', 'False').lower() == 'true'
-            
-            with bpy.data.libraries.load(asset_path, link=link) as (data_from, data_to):
-                # Import all objects
-                data_to.objects = data_from.objects
-            
-            # Add objects to the scene
-            imported_objects = []
-            for obj in data_to.objects:
-                if obj is not None:
-                    bpy.context.scene.collection.objects.link(obj)
-                    imported_objects.append(obj.name)
-            
-            return {
-                'success': True,
-                'message': f"Imported {len(imported_objects)} objects from {asset_path}",
-                'data': {
-                    'imported_objects': ','.join(imported_objects),
-                    'file_path': asset_path,
-                    'file_type': 'blend'
-                },
-                'list_data': imported_objects
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'message': f"Failed to import blend file: {e}",
-                'data': {},
-                'list_data': []
-            }
-    
+        # Link/append from the blend file
+        link = options.get('link', 'False').lower() == 'true'
+
+        with bpy.data.libraries.load(asset_path, link=link) as (data_from, data_to):
+            # Import all objects
+            data_to.objects = data_from.objects
+
+        # Add objects to the scene: filter the None placeholders once,
+        # then link through a cached bound method so the loop skips the
+        # four-attribute descriptor chain per object
+        loaded = [obj for obj in data_to.objects if obj is not None]
+        coll_link = bpy.context.scene.collection.objects.link
+        for obj in loaded:
+            coll_link(obj)
+        imported_objects = [obj.name for obj in loaded]
+
+        return {
+            'success': True,
+            'message': f"Imported {len(imported_objects)} objects from {asset_path}",
+            'data': {
+                'imported_objects': ','.join(imported_objects),
+                'file_path': asset_path,
+                'file_type': 'blend'
+            },
+            'list_data': imported_objects
+        }
+
+    @_wrap_import('OBJ file')
     def _import_obj_file(self, asset_path: str, options: Dict[str, str]) -> Dict[str, Any]:
         """Import an OBJ file."""
-        try:
-            # Set import options
-            bpy.ops.import_scene.obj(
-                filepath=asset_path,
-                use_edges=True,
-                use_smooth_groups=True,
-                use_split_objects=True,
-                use_split_groups=True,
-                use_groups_as_vgroups=False,
-                use_image_search=True,
-                split_mode='ON',
-                global_clamp_size=0.0
-            )
-            
-            # Get imported objects
-            imported_objects = [obj.name for obj in bpy.context.selected_objects]
-            
-            return {
-                'success': True,
-                'message': f"Imported OBJ file: {asset_path}",
-                'data': {
-                    'imported_objects': ','.join(imported_objects),
-                    'file_path': asset_path,
-                    'file_type': 'obj'
-                },
-                'list_data': imported_objects
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'message': f"Failed to import OBJ file: {e}",
-                'data': {},
-                'list_data': []
-            }
-    
+        # Set import options
+        bpy.ops.import_scene.obj(
+            filepath=asset_path,
+            use_edges=True,
+            use_smooth_groups=True,
+            use_split_objects=True,
+            use_split_groups=True,
+            use_groups_as_vgroups=False,
+            use_image_search=True,
+            split_mode='ON',
+            global_clamp_size=0.0
+        )
+
+        # Get imported objects
+        imported_objects = [obj.name for obj in bpy.context.selected_objects]
+
+        return {
+            'success': True,
+            'message': f"Imported OBJ file: {asset_path}",
+            'data': {
+                'imported_objects': ','.join(imported_objects),
+                'file_path': asset_path,
+                'file_type': 'obj'
+            },
+            'list_data': imported_objects
+        }
+
+    @_wrap_import('FBX file')
     def _import_fbx_file(self, asset_path: str, options: Dict[str, str]) -> Dict[str, Any]:
         """Import an FBX file."""
-        try:
-            bpy.ops.import_scene.fbx(filepath=asset_path)
-            
-            imported_objects = [obj.name for obj in bpy.context.selected_objects]
-            
-            return {
-                'success': True,
-                'message': f"Imported FBX file: {asset_path}",
-                'data': {
-                    'imported_objects': ','.join(imported_objects),
-                    'file_path': asset_path,
-                    'file_type': 'fbx'
-                },
-                'list_data': imported_objects
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'message': f"Failed to import FBX file: {e}",
-                'data': {},
-                'list_data': []
-            }
-    
+        bpy.ops.import_scene.fbx(filepath=asset_path)
+
+        imported_objects = [obj.name for obj in bpy.context.selected_objects]
+
+        return {
+            'success': True,
+            'message': f"Imported FBX file: {asset_path}",
+            'data': {
+                'imported_objects': ','.join(imported_objects),
+                'file_path': asset_path,
+                'file_type': 'fbx'
+            },
+            'list_data': imported_objects
+        }
+
+    @_wrap_import('Collada file')
     def _import_dae_file(self, asset_path: str, options: Dict[str, str]) -> Dict[str, Any]:
         """Import a Collada (DAE) file."""
-        try:
-            bpy.ops.wm.collada_import(filepath=asset_path)
-            
-            imported_objects = [obj.name for obj in bpy.context.selected_objects]
-            
-            return {
-                'success': True,
-                'message': f"Imported Collada file: {asset_path}",
-                'data': {
-                    'imported_objects': ','.join(imported_objects),
-                    'file_path': asset_path,
-                    'file_type': 'dae'
-                },
-                'list_data': imported_objects
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'message': f"Failed to import Collada file: {e}",
-                'data': {},
-                'list_data': []
-            }
-    
+        bpy.ops.wm.collada_import(filepath=asset_path)
+
+        imported_objects = [obj.name for obj in bpy.context.selected_objects]
+
+        return {
+            'success': True,
+            'message': f"Imported Collada file: {asset_path}",
+            'data': {
+                'imported_objects': ','.join(imported_objects),
+                'file_path': asset_path,
+                'file_type': 'dae'
+            },
+            'list_data': imported_objects
+        }
+
+    @_wrap_import('texture')
     def _import_texture(self, asset_path: str, options: Dict[str, str]) -> Dict[str, Any]:
         """Import a texture file."""
-        try:
-            # Create a new material
-            material_name = options.get('material_name', Path(asset_path).stem)
-            material = bpy.data.materials.new(name=material_name)
-            material.use_nodes = True
-            
-            # Get the principled BSDF node
-            principled = material.node_tree.nodes.get('Principled BSDF')
-            if principled:
-                # Load the texture
-                texture_node = material.node_tree.nodes.new('ShaderNodeTexImage')
-                texture_node.image = bpy.data.images.load(asset_path)
-                
-                # Connect to base color
-                material.node_tree.links.new(
-                    texture_node.outputs['Color'],
-                    principled.inputs['Base Color']
-                )
-            
-            return {
-                'success': True,
-                'message': f"Imported texture: {asset_path}",
-                'data': {
-                    'material_name': material_name,
-                    'file_path': asset_path,
-                    'file_type': 'texture'
-                },
-                'list_data': [material_name]
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'message': f"Failed to import texture: {e}",
-                'data': {},
-                'list_data': []
-            }
+        # Create a new material
+        material_name = options.get('material_name') or os.path.splitext(os.path.basename(asset_path))[0]
+        material = bpy.data.materials.new(name=material_name)
+        material.use_nodes = True
+
+        # Get the principled BSDF node
+        principled = material.node_tree.nodes.get('Principled BSDF')
+        if principled:
+            # Load the texture through the realpath-keyed cache; stale
+            # entries (datablock deleted since) are reloaded
+            key = os.path.realpath(asset_path)
+            img = self._image_cache.get(key)
+            if img is None or img.name not in bpy.data.images:
+                img = bpy.data.images.load(asset_path, check_existing=True)
+                self._image_cache[key] = img
+            texture_node = material.node_tree.nodes.new('ShaderNodeTexImage')
+            texture_node.image = img
+
+            # Connect to base color
+            material.node_tree.links.new(
+                texture_node.outputs['Color'],
+                principled.inputs['Base Color']
+            )
+
+        return {
+            'success': True,
+            'message': f"Imported texture: {asset_path}",
+            'data': {
+                'material_name': material_name,
+                'file_path': asset_path,
+                'file_type': 'texture'
+            },
+            'list_data': [material_name]
+        }
     
+    def _batch_validate(self, asset_paths: List[str]) -> set:
+        """
+        Check which of the given paths exist on disk.
+
+        Groups the paths by parent directory and reads each directory once
+        with os.scandir, so a batch of N assets costs one listing per
+        distinct directory instead of one stat syscall per path.
+
+        Args:
+            asset_paths: Paths to validate
+
+        Returns:
+            Set of the paths that exist
+        """
+        by_dir: Dict[str, List[Tuple[str, str]]] = {}
+        for path in asset_paths:
+            parent, base = os.path.split(path)
+            by_dir.setdefault(parent or '.', []).append((base, path))
+
+        valid = set()
+        for parent, entries in by_dir.items():
+            try:
+                with os.scandir(parent) as it:
+                    present = {entry.name for entry in it}
+            except OSError:
+                continue
+            for base, path in entries:
+                if base in present:
+                    valid.add(path)
+        return valid
+
+    def _missing_result(self, asset_path: str) -> Dict[str, Any]:
+        """Build the not-found failure result for a skipped path."""
+        return {
+            'success': False,
+            'message': f"Asset file not found: {asset_path}",
+            'data': {},
+            'list_data': []
+        }
+
     def import_assets_grid(self, asset_paths: List[str], options: Optional[Dict[str, str]] = None, 
                           rows: int = 1, cols: int = 1, spacing: float = 5.0) -> List[Dict[str, Any]]:
         """
@@ -417,28 +631,43 @@ class TahliaCore:
         results = []
         
         def grid_operation():
+            # One name resolution per positioned object: .get on a hoisted
+            # bpy.data.objects local instead of membership test plus index
+            objs = bpy.data.objects
+            # Vectorized layout: all positions computed in one C-level pass
+            positions = positions_grid(rows, cols, spacing)
+            # One scandir per directory up front instead of a stat per asset
+            valid = self._batch_validate(asset_paths)
+            placements = []
+
             for i, asset_path in enumerate(asset_paths):
                 if i >= rows * cols:
                     break
-                
-                row = i // cols
-                col = i % cols
-                
-                # Calculate position
-                x = col * spacing
-                y = row * spacing
-                
+
+                if asset_path not in valid:
+                    results.append(self._missing_result(asset_path))
+                    continue
+
                 # Import the asset
                 result = self._perform_import(asset_path, options)
-                
-                # Position the imported objects
+
+                # Record the placement; locations are written in one
+                # tight pass after every operator has run
                 if result['success']:
+                    x, y, z = positions[i]
                     for obj_name in result['list_data']:
-                        if obj_name in bpy.data.objects:
-                            obj = bpy.data.objects[obj_name]
-                            obj.location = (x, y, 0)
-                
+                        obj = objs.get(obj_name)
+                        if obj is not None:
+                            placements.append((obj, x, y, z))
+
                 results.append(result)
+
+            # One positioning pass and one explicit update: the depsgraph
+            # tags from all the location writes are flushed together
+            # instead of interleaving with each import's operator work
+            for obj, x, y, z in placements:
+                obj.location = (x, y, z)
+            bpy.context.view_layer.update()
         
         self.preserve_context(grid_operation)
         return results
@@ -462,23 +691,40 @@ class TahliaCore:
         results = []
         
         def circle_operation():
+            # One name resolution per positioned object: .get on a hoisted
+            # bpy.data.objects local instead of membership test plus index
+            objs = bpy.data.objects
+            # Vectorized layout: all angles computed in one C-level pass
+            positions = positions_circle(len(asset_paths), radius)
+            # One scandir per directory up front instead of a stat per asset
+            valid = self._batch_validate(asset_paths)
+            placements = []
+
             for i, asset_path in enumerate(asset_paths):
-                # Calculate position on circle
-                angle = (2 * 3.14159 * i) / len(asset_paths)
-                x = radius * math.cos(angle)
-                y = radius * math.sin(angle)
-                
+                if asset_path not in valid:
+                    results.append(self._missing_result(asset_path))
+                    continue
+
                 # Import the asset
                 result = self._perform_import(asset_path, options)
-                
-                # Position the imported objects
+
+                # Record the placement; locations are written in one
+                # tight pass after every operator has run
                 if result['success']:
+                    x, y, z = positions[i]
                     for obj_name in result['list_data']:
-                        if obj_name in bpy.data.objects:
-                            obj = bpy.data.objects[obj_name]
-                            obj.location = (x, y, 0)
-                
+                        obj = objs.get(obj_name)
+                        if obj is not None:
+                            placements.append((obj, x, y, z))
+
                 results.append(result)
+
+            # One positioning pass and one explicit update: the depsgraph
+            # tags from all the location writes are flushed together
+            # instead of interleaving with each import's operator work
+            for obj, x, y, z in placements:
+                obj.location = (x, y, z)
+            bpy.context.view_layer.update()
         
         self.preserve_context(circle_operation)
         return results
@@ -502,21 +748,40 @@ class TahliaCore:
         results = []
         
         def line_operation():
+            # One name resolution per positioned object: .get on a hoisted
+            # bpy.data.objects local instead of membership test plus index
+            objs = bpy.data.objects
+            # Vectorized layout: all positions computed in one C-level pass
+            positions = positions_line(len(asset_paths), spacing)
+            # One scandir per directory up front instead of a stat per asset
+            valid = self._batch_validate(asset_paths)
+            placements = []
+
             for i, asset_path in enumerate(asset_paths):
-                # Calculate position
-                x = i * spacing
-                
+                if asset_path not in valid:
+                    results.append(self._missing_result(asset_path))
+                    continue
+
                 # Import the asset
                 result = self._perform_import(asset_path, options)
-                
-                # Position the imported objects
+
+                # Record the placement; locations are written in one
+                # tight pass after every operator has run
                 if result['success']:
+                    x, y, z = positions[i]
                     for obj_name in result['list_data']:
-                        if obj_name in bpy.data.objects:
-                            obj = bpy.data.objects[obj_name]
-                            obj.location = (x, 0, 0)
-                
+                        obj = objs.get(obj_name)
+                        if obj is not None:
+                            placements.append((obj, x, y, z))
+
                 results.append(result)
+
+            # One positioning pass and one explicit update: the depsgraph
+            # tags from all the location writes are flushed together
+            # instead of interleaving with each import's operator work
+            for obj, x, y, z in placements:
+                obj.location = (x, y, z)
+            bpy.context.view_layer.update()
         
         self.preserve_context(line_operation)
         return results
@@ -536,18 +801,19 @@ class TahliaCore:
             options = {}
         
         try:
-            material = bpy.data.materials.new(name=name)
-            material.use_nodes = True
-            
-            # Apply material options
-            if 'metallic' in options:
-                material.node_tree.nodes['Principled BSDF'].inputs['Metallic'].default_value = float(options['metallic'])
-            if 'roughness' in options:
-                material.node_tree.nodes['Principled BSDF'].inputs['Roughness'].default_value = float(options['roughness'])
-            if 'base_color' in options:
-                # Parse color (assuming format like "1.0,0.5,0.2")
-                color_values = [float(x) for x in options['base_color'].split(',')]
-                material.node_tree.nodes['Principled BSDF'].inputs['Base Color'].default_value = (*color_values, 1.0)
+            material = _material_template().copy()
+            material.name = name
+            material.use_fake_user = False
+
+            # Apply material options through one cached node/inputs pair
+            inputs = material.node_tree.nodes['Principled BSDF'].inputs
+            for key, input_name in _PBR_MAP:
+                value = options.get(key)
+                if value is not None:
+                    inputs[input_name].default_value = float(value)
+            base_color = options.get('base_color')
+            if base_color is not None:
+                inputs['Base Color'].default_value = _parse_base_color(base_color)
             
             return {
                 'success': True,
@@ -581,25 +847,16 @@ class TahliaCore:
             options = {}
         
         try:
-            material = bpy.data.materials.new(name=name)
-            material.use_nodes = True
-            
-            # Get the principled BSDF node
-            principled = material.node_tree.nodes['Principled BSDF']
-            
-            # Apply PBR settings
-            if 'metallic' in options:
-                principled.inputs['Metallic'].default_value = float(options['metallic'])
-            if 'roughness' in options:
-                principled.inputs['Roughness'].default_value = float(options['roughness'])
-            if 'specular' in options:
-                principled.inputs['Specular'].default_value = float(options['specular'])
-            if 'ior' in options:
-                principled.inputs['IOR'].default_value = float(options['ior'])
-            if 'transmission' in options:
-                principled.inputs['Transmission'].default_value = float(options['transmission'])
-            if 'alpha' in options:
-                principled.inputs['Alpha'].default_value = float(options['alpha'])
+            material = _material_template().copy()
+            material.name = name
+            material.use_fake_user = False
+
+            # Apply PBR settings through one cached node/inputs pair
+            inputs = material.node_tree.nodes['Principled BSDF'].inputs
+            for key, input_name in _PBR_MAP:
+                value = options.get(key)
+                if value is not None:
+                    inputs[input_name].default_value = float(value)
             
             return {
                 'success': True,
@@ -625,8 +882,13 @@ class TahliaCore:
         Returns:
             Dict containing supported formats by category
         """
-        return self.supported_formats
+        # List the frozensets out for API compatibility
+        return {category: sorted(exts) for category, exts in self._SUPPORTED_FORMATS.items()}
     
+    def clear_image_cache(self) -> None:
+        """Drop all cached image datablock references."""
+        self._image_cache.clear()
+
     def set_debug_mode(self, enable: bool) -> None:
         """
         Enable or disable debug mode.
@@ -635,10 +897,9 @@ class TahliaCore:
             enable: True to enable debug mode, False to disable
         """
         self.debug_mode = enable
-        if enable:
-            logging.getLogger().setLevel(logging.DEBUG)
-        else:
-            logging.getLogger().setLevel(logging.INFO)
+        # Scope the level change to this module's logger; reaching for the
+        # root logger would retune every logger in the process
+        logger.setLevel(logging.DEBUG if enable else logging.INFO)
     
     def set_context_preservation(self, enable: bool) -> None:
         """
@@ -658,40 +919,49 @@ class TahliaCore:
         """
         self.max_context_stack_size = max_size
 
-# Create a global instance
-tahlia = TahliaCore()
+# Default instance backing the module-level convenience functions,
+# constructed lazily so importing the module (e.g. just for the layout
+# helpers) no longer pays for TahliaCore initialization up front
+_default_instance: Optional[TahliaCore] = None
+
+def _get_default() -> TahliaCore:
+    """Return the shared TahliaCore instance, creating it on first use."""
+    global _default_instance
+    if _default_instance is None:
+        _default_instance = TahliaCore()
+    return _default_instance
 
 # Export the main functions for easy access
 def import_asset(asset_path: str, options: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     """Import a single asset."""
-    return tahlia.import_asset(asset_path, options)
+    return _get_default().import_asset(asset_path, options)
 
-def import_assets_grid(asset_paths: List[str], options: Optional[Dict[str, str]] = None, 
+def import_assets_grid(asset_paths: List[str], options: Optional[Dict[str, str]] = None,
                       rows: int = 1, cols: int = 1, spacing: float = 5.0) -> List[Dict[str, Any]]:
     """Import multiple assets in a grid pattern."""
-    return tahlia.import_assets_grid(asset_paths, options, rows, cols, spacing)
+    return _get_default().import_assets_grid(asset_paths, options, rows, cols, spacing)
 
-def import_assets_circle(asset_paths: List[str], options: Optional[Dict[str, str]] = None, 
+def import_assets_circle(asset_paths: List[str], options: Optional[Dict[str, str]] = None,
                         radius: float = 10.0) -> List[Dict[str, Any]]:
     """Import multiple assets in a circle pattern."""
-    return tahlia.import_assets_circle(asset_paths, options, radius)
+    return _get_default().import_assets_circle(asset_paths, options, radius)
 
-def import_assets_line(asset_paths: List[str], options: Optional[Dict[str, str]] = None, 
+def import_assets_line(asset_paths: List[str], options: Optional[Dict[str, str]] = None,
                       spacing: float = 5.0) -> List[Dict[str, Any]]:
     """Import multiple assets in a line pattern."""
-    return tahlia.import_assets_line(asset_paths, options, spacing)
+    return _get_default().import_assets_line(asset_paths, options, spacing)
 
 def create_material(name: str, options: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     """Create a new material."""
-    return tahlia.create_material(name, options)
+    return _get_default().create_material(name, options)
 
 def create_pbr_material(name: str, options: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     """Create a PBR material."""
-    return tahlia.create_pbr_material(name, options)
+    return _get_default().create_pbr_material(name, options)
 
 def get_supported_formats() -> Dict[str, List[str]]:
     """Get supported file formats."""
-    return tahlia.get_supported_formats()
+    return _get_default().get_supported_formats()
 
 # Version info
 __version__ = "1.0.0"